@@ -4,15 +4,18 @@ Enhanced 99acres.com listing card extractor with comprehensive data extraction
 """
 
 import os
+import sys
 import time
 import logging
 import random
+import numpy as np
 import pandas as pd
+import xlsxwriter
 from datetime import datetime
 import re
 from bs4 import BeautifulSoup
 import json
-from urllib.parse import urljoin, urlparse, quote_plus, parse_qs
+from urllib.parse import urljoin, urlparse, urlsplit, quote_plus, parse_qs
 import configparser
 from selenium.common.exceptions import (
     TimeoutException,
@@ -21,9 +24,24 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 import undetected_chromedriver as uc
+from utils import enable_keep_alive, write_sheet_rows
 from typing import List, Dict, Optional, Tuple
 import requests
 from dataclasses import dataclass, field
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from playwright.sync_api import sync_playwright, Error as PlaywrightError
+except ImportError:  # Playwright is optional; Selenium handles everything without it
+    sync_playwright = None
+    PlaywrightError = None
 
 # Add these imports
 from selenium.webdriver.common.by import By
@@ -38,6 +56,56 @@ DEFAULT_USER_AGENT = (
     "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 )
 
+# Card classes 99acres renders single properties with; used to detect listing content.
+# Only card-level listing classes, since a bare *='listing' also hits listingContainer-style wrappers
+PROPERTY_CARD_SELECTOR = (
+    ".projectTuple, ._srpTuple, .srpTuple, [class*='Tuple'], [class*='tuple'], .listing-card, .property-card"
+)
+
+# In-browser probe: click the first visible, enabled element matching any selector
+LOAD_MORE_PROBE_JS = """
+const sels = arguments[0];
+for (const s of sels) {
+    for (const el of document.querySelectorAll(s)) {
+        const r = el.getBoundingClientRect();
+        if (r.width > 0 && r.height > 0 && r.top + window.scrollY > 0 && !el.disabled) {
+            el.scrollIntoView();
+            el.click();
+            return s;
+        }
+    }
+}
+return null;
+"""
+
+# In-browser sweep: click every visible element matching the close selector group
+DISMISS_POPUPS_JS = """
+let n = 0;
+document.querySelectorAll(arguments[0]).forEach(e => {
+    if (e.offsetParent !== null) {
+        try { e.click(); n++; } catch (_) {}
+    }
+});
+return n;
+"""
+
+
+def _parse_links_json(links_json):
+    """Decode a serialized all_links cell, returning None if it is malformed"""
+    try:
+        if orjson is not None:
+            return orjson.loads(links_json)
+        return json.loads(links_json)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=16384)
+def _netloc(url: str) -> str:
+    """Return the network location of a URL, memoized across repeated links"""
+    return urlsplit(url).netloc
+
+
 @dataclass
 class ListingData:
     """Structure for holding listing card data"""
@@ -78,6 +146,46 @@ class ListingData:
 class Acres99Scraper:
     """Scraper for 99acres.com with comprehensive data extraction"""
 
+    # Common popup close selectors
+    CLOSE_SELECTORS = [
+        "button[aria-label*='close']",
+        "button[aria-label*='Close']",
+        "button[title*='close']",
+        "button[title*='Close']",
+        ".modal-close",
+        ".popup-close",
+        ".close-btn",
+        ".close-button",
+        "[data-testid*='close']",
+        "[data-dismiss*='modal']",
+        ".overlay .close",
+        "button.close",
+        "[class*='close'][class*='button']",
+        ".closeIcon",  # 99acres specific
+        ".popup__close",  # 99acres specific
+        ".modal__close"  # 99acres specific
+    ]
+    JOINED_CLOSE_SELECTORS = ", ".join(CLOSE_SELECTORS)
+
+    # Core fields checked for completeness in the quality reports
+    QUALITY_FIELDS = [
+        'building_name', 'price', 'apartment_type', 'buildup_area',
+        'facing', 'bathrooms', 'parking', 'nearby_places_count'
+    ]
+
+    # Column order of the records built by _listing_data_to_dict
+    SCHEMA_FIELDS = [
+        'listing_index', 'building_name', 'developer_name', 'price', 'emi',
+        'buildup_area', 'facing', 'apartment_type', 'bathrooms', 'parking',
+        'floor', 'furnishing', 'property_age', 'broker_info',
+        'verification_status', 'possession_date', 'location', 'city',
+        'property_id', 'listing_url', 'description', 'features',
+        'image_count', 'image_urls', 'nearby_places_count', 'nearby_places',
+        'nearby_place_1', 'nearby_place_2', 'nearby_place_3', 'nearby_place_4',
+        'nearby_place_5', 'links_count', 'links_summary', 'all_links',
+        'amenities_count', 'amenities', 'extraction_timestamp', 'run_id'
+    ]
+
     def __init__(self, config, run_id: str, start_ts: datetime):
         self.config = config
         self.run_id = run_id
@@ -90,6 +198,8 @@ class Acres99Scraper:
         
         self.output_dir = config.get("output", "output_dir", fallback="output")
         os.makedirs(self.output_dir, exist_ok=True)
+        # Above this many listings the main table goes to CSV instead of the workbook
+        self.csv_listings_threshold = int(config.get("output", "csv_listings_threshold", fallback="2000"))
         
         timestamp = self.start_ts.strftime("%Y%m%d_%H%M%S")
         self.final_output_path = os.path.join(
@@ -114,6 +224,10 @@ class Acres99Scraper:
         self.driver = None
         self.wait = None
         self.actions = None
+        
+        # Playwright handle attached to the same Chrome over CDP (optional)
+        self._pw = None
+        self._page = None
 
     def _setup_enhanced_webdriver(self):
         """Setup Chrome WebDriver with enhanced capabilities"""
@@ -136,18 +250,63 @@ class Acres99Scraper:
             options.add_experimental_option("prefs", prefs)
             options.add_argument(f"--user-agent={DEFAULT_USER_AGENT}")
             
+            # Return from driver.get at DOMContentLoaded; images and trackers keep loading
+            # in the background and navigate_and_setup waits explicitly for listing content
+            options.page_load_strategy = "eager"
+            
             self.driver = uc.Chrome(options=options)
+            enable_keep_alive(self.driver)
             self.driver.set_window_size(1920, 1080)
             
             self.wait = WebDriverWait(self.driver, 10)
             self.actions = ActionChains(self.driver)
             
+            self._attach_playwright()
+            
             logging.info("Enhanced WebDriver setup completed")
             
         except Exception as e:
             logging.error(f"Enhanced WebDriver setup failed: {e}")
             raise
 
+    def _attach_playwright(self):
+        """Attach Playwright to the WebDriver's Chrome so page-level calls use CDP directly"""
+        if sync_playwright is None:
+            return
+        
+        try:
+            chrome_options = self.driver.capabilities.get("goog:chromeOptions", {})
+            debugger_address = chrome_options.get("debuggerAddress")
+            if not debugger_address:
+                return
+            
+            self._pw = sync_playwright().start()
+            browser = self._pw.chromium.connect_over_cdp(f"http://{debugger_address}")
+            self._page = browser.contexts[0].pages[0]
+            logging.info("Playwright attached to WebDriver browser over CDP")
+            
+        except Exception as e:
+            logging.debug(f"Playwright attach failed, using Selenium only: {e}")
+            self._detach_playwright()
+
+    def _detach_playwright(self):
+        """Stop the Playwright driver without closing the shared browser"""
+        try:
+            if self._pw:
+                self._pw.stop()
+        except Exception:
+            pass
+        self._pw = None
+        self._page = None
+
+    def _evaluate(self, script: str, *args):
+        """Run a WebDriver-style script (reading `arguments`) over CDP when attached"""
+        if self._page is not None:
+            return self._page.evaluate(
+                "(args) => (function() {" + script + "}).apply(null, args)", list(args)
+            )
+        return self.driver.execute_script(script, *args)
+
     def find_property_cards_improved(self) -> List:
         """Improved method to find property cards using multiple strategies"""
         cards = []
@@ -913,6 +1072,9 @@ class Acres99Scraper:
     def _extract_additional_details_improved(self, card_element, listing_data: ListingData, card_text: str):
         """Extract additional property details with improved parsing"""
         try:
+            # Cheap literal checks gate each regex group below
+            card_text_lower = card_text.lower()
+            
             # Floor information - improved patterns
             floor_patterns = [
                 r'(\d+)(?:st|nd|rd|th)?\s*Floor',
@@ -920,11 +1082,12 @@ class Acres99Scraper:
                 r'(\d+)\s*/\s*\d+\s*Floor'  # Like "3/5 Floor"
             ]
             
-            for pattern in floor_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
-                if match:
-                    listing_data.floor = f"{match.group(1)} Floor"
-                    break
+            if 'floor' in card_text_lower:
+                for pattern in floor_patterns:
+                    match = re.search(pattern, card_text, re.IGNORECASE)
+                    if match:
+                        listing_data.floor = f"{match.group(1)} Floor"
+                        break
             
             # Furnishing status - comprehensive patterns
             furnishing_patterns = [
@@ -934,11 +1097,12 @@ class Acres99Scraper:
                 r'\b(Furnished)\b'
             ]
             
-            for pattern in furnishing_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
-                if match:
-                    listing_data.furnishing = match.group(1).title()
-                    break
+            if 'furnished' in card_text_lower:
+                for pattern in furnishing_patterns:
+                    match = re.search(pattern, card_text, re.IGNORECASE)
+                    if match:
+                        listing_data.furnishing = match.group(1).title()
+                        break
             
             # Property age
             age_patterns = [
@@ -947,11 +1111,12 @@ class Acres99Scraper:
                 r'(\d+)\s*Yr[s]?\s*Old'
             ]
             
-            for pattern in age_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
-                if match:
-                    listing_data.property_age = f"{match.group(1)} years"
-                    break
+            if 'year' in card_text_lower or 'yr' in card_text_lower:
+                for pattern in age_patterns:
+                    match = re.search(pattern, card_text, re.IGNORECASE)
+                    if match:
+                        listing_data.property_age = f"{match.group(1)} years"
+                        break
             
             # Broker/Owner information
             broker_patterns = [
@@ -980,11 +1145,13 @@ class Acres99Scraper:
                 r'Under\s*Construction'
             ]
             
-            for pattern in possession_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
-                if match:
-                    listing_data.possession_date = match.group(1) if match.groups() else match.group(0)
-                    break
+            if ('possession' in card_text_lower or 'ready' in card_text_lower or
+                    'construction' in card_text_lower):
+                for pattern in possession_patterns:
+                    match = re.search(pattern, card_text, re.IGNORECASE)
+                    if match:
+                        listing_data.possession_date = match.group(1) if match.groups() else match.group(0)
+                        break
             
             # Amenities - comprehensive detection
             amenity_keywords = [
@@ -996,7 +1163,6 @@ class Acres99Scraper:
             ]
             
             found_amenities = []
-            card_text_lower = card_text.lower()
             
             for amenity in amenity_keywords:
                 if amenity in card_text_lower:
@@ -1257,7 +1423,10 @@ class Acres99Scraper:
         
         # Add all links as JSON string
         if listing_data.all_links:
-            data_dict['all_links'] = json.dumps(listing_data.all_links)
+            if orjson is not None:
+                data_dict['all_links'] = orjson.dumps(listing_data.all_links).decode()
+            else:
+                data_dict['all_links'] = json.dumps(listing_data.all_links)
         else:
             data_dict['all_links'] = ''
         
@@ -1326,54 +1495,44 @@ class Acres99Scraper:
                 ".srp__next"  # 99acres specific
             ]
             
-            for selector in load_more_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if (element.is_displayed() and element.is_enabled() and 
-                            element.location['y'] > 0):  # Must be visible on screen
-                            
-                            # Scroll to button
-                            self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                            time.sleep(0.5)
-                            
-                            # Try clicking
-                            self.driver.execute_script("arguments[0].click();", element)
-                            logging.info(f"Successfully clicked load more button: {selector}")
-                            return True
-                except Exception as elem_e:
-                    logging.debug(f"Failed to click element with selector {selector}: {elem_e}")
-                    continue
-            
-            # Try by text content with broader search
+            # Probe all selectors in a single round-trip instead of per-element checks
+            try:
+                clicked = self._evaluate(LOAD_MORE_PROBE_JS, load_more_selectors)
+                if clicked:
+                    logging.info(f"Successfully clicked load more button: {clicked}")
+                    return True
+            except Exception as probe_e:
+                logging.debug(f"Load more probe failed: {probe_e}")
+            
+            # Try by text content with one XPath union over all texts
             load_texts = ["Load More", "Show More", "View More", "Load Additional", "See More", "More Results", "Next", "Next Page"]
+            xpath_patterns = []
             for text in load_texts:
-                try:
-                    # Try both button and link elements
-                    xpath_patterns = [
-                        f"//button[contains(normalize-space(text()), '{text}')]",
-                        f"//a[contains(normalize-space(text()), '{text}')]",
-                        f"//*[@role='button'][contains(normalize-space(text()), '{text}')]"
-                    ]
-                    
-                    for xpath in xpath_patterns:
-                        elements = self.driver.find_elements(By.XPATH, xpath)
-                        for element in elements:
-                            if (element.is_displayed() and element.is_enabled() and 
-                                element.location['y'] > 0):
-                                
-                                # Scroll to button
-                                self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                                time.sleep(0.5)
-                                
-                                # Try clicking
-                                self.driver.execute_script("arguments[0].click();", element)
-                                logging.info(f"Successfully clicked load more by text: {text}")
-                                return True
-                                
-                except Exception as text_e:
-                    logging.debug(f"Failed to click by text '{text}': {text_e}")
-                    continue
+                xpath_patterns.extend([
+                    f"//button[contains(normalize-space(text()), '{text}')]",
+                    f"//a[contains(normalize-space(text()), '{text}')]",
+                    f"//*[@role='button'][contains(normalize-space(text()), '{text}')]"
+                ])
+            
+            try:
+                elements = self.driver.find_elements(By.XPATH, " | ".join(xpath_patterns))
+                for element in elements:
+                    if (element.is_displayed() and element.is_enabled() and 
+                        element.location['y'] > 0):
+                        
+                        button_text = element.text.strip()
+                        
+                        # Scroll to button
+                        self.driver.execute_script("arguments[0].scrollIntoView();", element)
+                        time.sleep(0.5)
+                        
+                        # Try clicking
+                        self.driver.execute_script("arguments[0].click();", element)
+                        logging.info(f"Successfully clicked load more by text: {button_text}")
+                        return True
+                        
+            except Exception as text_e:
+                logging.debug(f"Failed to click load more by text: {text_e}")
             
             return False
             
@@ -1384,37 +1543,16 @@ class Acres99Scraper:
     def _dismiss_popups_advanced(self):
         """Enhanced popup dismissal with comprehensive detection"""
         try:
-            # Common popup close selectors
-            close_selectors = [
-                "button[aria-label*='close']",
-                "button[aria-label*='Close']", 
-                "button[title*='close']",
-                "button[title*='Close']",
-                ".modal-close",
-                ".popup-close",
-                ".close-btn",
-                ".close-button",
-                "[data-testid*='close']",
-                "[data-dismiss*='modal']",
-                ".overlay .close",
-                "button.close",
-                "[class*='close'][class*='button']",
-                ".closeIcon",  # 99acres specific
-                ".popup__close",  # 99acres specific
-                ".modal__close"  # 99acres specific
-            ]
-            
+            # Find and click every visible close button in a single round-trip
             dismissed_count = 0
-            for selector in close_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            self.driver.execute_script("arguments[0].click();", element)
-                            dismissed_count += 1
-                            time.sleep(0.3)
-                except:
-                    continue
+            try:
+                dismissed_count = self._evaluate(
+                    DISMISS_POPUPS_JS, self.JOINED_CLOSE_SELECTORS
+                ) or 0
+                if dismissed_count > 0:
+                    time.sleep(0.2)
+            except:
+                pass
             
             if dismissed_count > 0:
                 logging.debug(f"Dismissed {dismissed_count} popups")
@@ -1433,25 +1571,41 @@ class Acres99Scraper:
         """Navigate to URL and perform initial setup"""
         try:
             logging.info(f"Navigating to: {url}")
-            self.driver.get(url)
-            time.sleep(5)
+            if self._page is not None:
+                self._page.goto(url, wait_until="domcontentloaded")
+            else:
+                self.driver.get(url)
+            
+            # Wait for DOMContentLoaded only, matching the eager page-load strategy;
+            # the property content wait below covers the listings themselves
+            # Over CDP, evaluate raises while a navigation swaps the execution context; keep polling
+            try:
+                WebDriverWait(
+                    self.driver, 15,
+                    ignored_exceptions=(PlaywrightError,) if PlaywrightError is not None else None
+                ).until(
+                    lambda d: self._evaluate("return document.readyState") != "loading"
+                )
+            except TimeoutException:
+                logging.warning("Page load timeout, continuing anyway...")
             
             # Initial popup dismissal
             self._dismiss_popups_advanced()
             
-            # Wait for page to load
+            # Wait for dynamic property content to render
             try:
-                self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                # Wait a bit more for dynamic content
-                time.sleep(3)
+                self.wait.until(EC.presence_of_element_located(
+                    (By.XPATH, "//*[contains(text(), '₹') or contains(text(), 'BHK')]")
+                ))
             except TimeoutException:
-                logging.warning("Page load timeout, continuing anyway...")
+                logging.warning("Property content wait timed out, continuing anyway...")
             
             # Check if we can find any property-related content
-            property_indicators = self.driver.find_elements(By.XPATH, 
-                "//*[contains(text(), '₹') or contains(text(), 'BHK') or contains(text(), 'Lacs')]")
+            has_property_content = self._evaluate(
+                "return !!document.querySelector(arguments[0]);", PROPERTY_CARD_SELECTOR
+            )
             
-            if not property_indicators:
+            if not has_property_content:
                 logging.warning("No property content found on page - may need manual setup")
             
             logging.info("="*70)
@@ -1466,10 +1620,13 @@ class Acres99Scraper:
             logging.info(f" Auto-start in {self.manual_wait_time} seconds...")
             logging.info("="*70)
             
-            # Countdown
-            for i in range(self.manual_wait_time, 0, -1):
-                print(f"\rStarting extraction in {i:2d} seconds... ", end="", flush=True)
-                time.sleep(1)
+            # Countdown - only worth ticking per second when someone is watching
+            if sys.stdout.isatty():
+                for i in range(self.manual_wait_time, 0, -1):
+                    print(f"\rStarting extraction in {i:2d} seconds... ", end="", flush=True)
+                    time.sleep(1)
+            elif self.manual_wait_time > 0:
+                time.sleep(self.manual_wait_time)
             
             print("\n Starting improved property extraction...")
             
@@ -1482,14 +1639,19 @@ class Acres99Scraper:
             logging.error(f"Navigation and setup failed: {e}")
             return False
 
-    def save_enhanced_data(self, extracted_data: List[Dict]) -> Optional[str]:
+    def save_enhanced_data(self, extracted_data: List[Dict], df: Optional[pd.DataFrame] = None,
+                           field_counts: Optional[Dict] = None) -> Optional[str]:
         """Save extracted data with enhanced formatting and analysis"""
         try:
             if not extracted_data:
                 logging.warning("No data to save")
                 return None
             
-            df = pd.DataFrame(extracted_data)
+            # Reuse a caller-built frame instead of re-inferring it from the records
+            if df is None:
+                df = self._build_dataframe(extracted_data)
+            if field_counts is None:
+                field_counts = self._compute_field_counts(df)
             
             # Create output file with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1497,10 +1659,33 @@ class Acres99Scraper:
                 self.output_dir, 
                 f"99acres_extraction_{timestamp}.xlsx"
             )
-            
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                # Main data sheet
-                df.to_excel(writer, sheet_name="Property_Listings", index=False)
+            listings_csv_path = None
+            if len(df) > self.csv_listings_threshold:
+                listings_csv_path = output_path.replace(".xlsx", "_listings.csv")
+            
+            # The analysis passes are independent; run them concurrently before the serial write
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                quality_future = executor.submit(self._analyze_data_quality, df, field_counts)
+                nearby_future = executor.submit(self._analyze_nearby_places, df)
+                links_future = executor.submit(self._analyze_links, df)
+                quality_metrics = quality_future.result()
+                nearby_analysis = nearby_future.result()
+                links_analysis = links_future.result()
+            
+            # Stream every sheet row by row; constant_memory keeps only the current row in RAM
+            with xlsxwriter.Workbook(output_path, {
+                "constant_memory": True,
+                "strings_to_formulas": False,
+                "strings_to_urls": False
+            }) as workbook:
+                # Main data sheet - large tables are far cheaper to serialize as CSV
+                if listings_csv_path:
+                    df.to_csv(listings_csv_path, index=False)
+                else:
+                    write_sheet_rows(
+                        workbook, "Property_Listings", list(df.columns),
+                        df.itertuples(index=False, name=None)
+                    )
                 
                 # Summary sheet
                 summary_data = {
@@ -1527,38 +1712,42 @@ class Acres99Scraper:
                         f"{(self.extraction_stats['successful_extractions'] / max(1, self.extraction_stats['total_cards_found'])) * 100:.1f}%",
                         self.extraction_stats["images_downloaded"],
                         self.extraction_stats["links_extracted"],
-                        len(df[df['price'].notna() & (df['price'] != '')]),
-                        len(df[df['nearby_places_count'] > 0]),
-                        f"{df['nearby_places_count'].mean():.1f}",
+                        field_counts.get('price', 0),
+                        field_counts.get('nearby_places_count', 0),
+                        f"{field_counts.get('avg_nearby_places', 0.0):.1f}",
                         self.start_ts.strftime("%Y-%m-%d %H:%M:%S"),
                         datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         f"{(datetime.now() - self.start_ts).total_seconds() / 60:.1f}"
                     ]
                 }
                 
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name="Extraction_Summary", index=False)
+                write_sheet_rows(
+                    workbook, "Extraction_Summary", list(summary_data),
+                    zip(summary_data["Metric"], summary_data["Value"])
+                )
                 
                 # Data quality analysis
-                quality_metrics = self._analyze_data_quality(df)
-                quality_df = pd.DataFrame(list(quality_metrics.items()), columns=["Field", "Completeness"])
-                quality_df.to_excel(writer, sheet_name="Data_Quality", index=False)
+                write_sheet_rows(
+                    workbook, "Data_Quality", ["Field", "Completeness"], quality_metrics.items()
+                )
                 
                 # Nearby places analysis
-                if 'nearby_places' in df.columns:
-                    nearby_analysis = self._analyze_nearby_places(df)
-                    if nearby_analysis:
-                        nearby_df = pd.DataFrame(nearby_analysis)
-                        nearby_df.to_excel(writer, sheet_name="Nearby_Places_Analysis", index=False)
+                if nearby_analysis:
+                    write_sheet_rows(
+                        workbook, "Nearby_Places_Analysis", list(nearby_analysis[0]),
+                        (row.values() for row in nearby_analysis)
+                    )
                 
                 # Links analysis
-                if 'all_links' in df.columns:
-                    links_analysis = self._analyze_links(df)
-                    if links_analysis:
-                        links_df = pd.DataFrame(links_analysis)
-                        links_df.to_excel(writer, sheet_name="Links_Analysis", index=False)
+                if links_analysis:
+                    write_sheet_rows(
+                        workbook, "Links_Analysis", list(links_analysis[0]),
+                        (row.values() for row in links_analysis)
+                    )
             
             logging.info(f"Enhanced data saved to: {output_path}")
+            if listings_csv_path:
+                logging.info(f"Property listings saved to: {listings_csv_path}")
             return output_path
             
         except Exception as e:
@@ -1574,27 +1763,46 @@ class Acres99Scraper:
                 logging.error(f"Even CSV fallback failed: {csv_e}")
                 return None
 
-    def _analyze_data_quality(self, df: pd.DataFrame) -> Dict:
+    def _build_dataframe(self, extracted_data: List[Dict]) -> pd.DataFrame:
+        """Build a DataFrame column-by-column from records sharing SCHEMA_FIELDS"""
+        return pd.DataFrame({
+            field_name: [record.get(field_name) for record in extracted_data]
+            for field_name in self.SCHEMA_FIELDS
+        })
+
+    def _compute_field_counts(self, df: pd.DataFrame) -> Dict:
+        """Count filled values per quality field, converting each column to an array once"""
+        counts = {}
+        for field_name in self.QUALITY_FIELDS:
+            if field_name not in df.columns:
+                continue
+            
+            if field_name == 'nearby_places_count':
+                values = df[field_name].to_numpy(dtype=float)
+                counts[field_name] = int(np.count_nonzero(values > 0))
+                counts['avg_nearby_places'] = float(np.nanmean(values)) if len(values) else 0.0
+            else:
+                values = df[field_name].to_numpy(dtype=object)
+                counts[field_name] = int(np.count_nonzero(pd.notna(values) & (values != '')))
+        
+        return counts
+
+    def _analyze_data_quality(self, df: pd.DataFrame, field_counts: Optional[Dict] = None) -> Dict:
         """Analyze data quality with comprehensive metrics"""
         try:
             metrics = {}
             total_records = len(df)
             
-            # Core field completeness analysis
-            important_fields = [
-                'building_name', 'price', 'apartment_type', 'buildup_area',
-                'facing', 'bathrooms', 'parking', 'nearby_places_count'
-            ]
+            # Core field completeness analysis, reusing counts from the Summary sheet when given
+            if field_counts is None:
+                field_counts = self._compute_field_counts(df)
             
-            for field in important_fields:
-                if field in df.columns:
-                    if field == 'nearby_places_count':
-                        complete_count = len(df[df[field] > 0])
-                    else:
-                        complete_count = len(df[df[field].notna() & (df[field] != '')])
-                    
-                    percentage = (complete_count / total_records * 100) if total_records > 0 else 0
-                    metrics[field] = f"{complete_count}/{total_records} ({percentage:.1f}%)"
+            for field in self.QUALITY_FIELDS:
+                if field not in field_counts:
+                    continue
+                complete_count = field_counts[field]
+                percentage = (complete_count / total_records * 100) if total_records > 0 else 0
+                metrics[field] = f"{complete_count}/{total_records} ({percentage:.1f}%)"
             
             return metrics
             
@@ -1608,27 +1816,26 @@ class Acres99Scraper:
             if 'nearby_places' not in df.columns:
                 return []
             
-            # Count frequency of nearby places
-            all_places = []
-            for places_str in df['nearby_places'].dropna():
-                if places_str:
-                    places = [place.strip() for place in places_str.split(',')]
-                    all_places.extend(places)
+            # Split, flatten and count places with pandas string ops
+            places = df['nearby_places'].dropna()
+            places = places[places != '']
+            all_places = places.str.split(',').explode().str.strip()
+            all_places = all_places[all_places != '']
             
-            if not all_places:
+            if all_places.empty:
                 return []
             
             # Count frequency
-            from collections import Counter
-            place_counts = Counter(all_places)
+            place_counts = all_places.value_counts().head(20)  # Top 20
+            percentages = place_counts.values / len(all_places) * 100
             
             # Create analysis data
             analysis_data = []
-            for place, count in place_counts.most_common(20):  # Top 20
+            for place, count, percentage in zip(place_counts.index, place_counts.values, percentages):
                 analysis_data.append({
                     'Place': place,
-                    'Frequency': count,
-                    'Percentage': f"{(count / len(all_places) * 100):.1f}%"
+                    'Frequency': int(count),
+                    'Percentage': f"{percentage:.1f}%"
                 })
             
             return analysis_data
@@ -1647,27 +1854,27 @@ class Acres99Scraper:
             all_link_texts = []
             all_link_domains = []
             
-            for links_json in df['all_links'].dropna():
-                if links_json:
-                    try:
-                        links = json.loads(links_json)
-                        for link in links:
-                            if 'text' in link and link['text']:
-                                all_link_texts.append(link['text'].lower())
-                            
-                            if 'url' in link and link['url']:
-                                url = link['url']
-                                parsed = urlparse(url)
-                                if parsed.netloc:
-                                    all_link_domains.append(parsed.netloc)
-                    except:
-                        continue
+            # Decode every cell up front; malformed JSON becomes None and is dropped
+            links_column = df['all_links'].dropna()
+            parsed_links = links_column[links_column != ''].map(_parse_links_json).dropna()
+            
+            # Collect texts and domains in a single pass over the decoded links
+            for links in parsed_links:
+                for link in links:
+                    text = link.get('text')
+                    if text:
+                        all_link_texts.append(text.lower())
+                    
+                    url = link.get('url')
+                    if url:
+                        netloc = _netloc(url)
+                        if netloc:
+                            all_link_domains.append(netloc)
             
             analysis_data = []
             
             # Analyze link texts
             if all_link_texts:
-                from collections import Counter
                 text_counts = Counter(all_link_texts)
                 
                 for text, count in text_counts.most_common(15):
@@ -1680,7 +1887,6 @@ class Acres99Scraper:
             
             # Analyze link domains
             if all_link_domains:
-                from collections import Counter
                 domain_counts = Counter(all_link_domains)
                 
                 for domain, count in domain_counts.most_common(10):
@@ -1715,11 +1921,13 @@ class Acres99Scraper:
                 logging.warning("No data was extracted")
                 return None
             
-            # Save results
-            output_path = self.save_enhanced_data(extracted_data)
+            # Save results from a single DataFrame build and one set of field counts
+            df = self._build_dataframe(extracted_data)
+            field_counts = self._compute_field_counts(df)
+            output_path = self.save_enhanced_data(extracted_data, df=df, field_counts=field_counts)
             
             # Print final summary
-            self._print_final_summary(extracted_data)
+            self._print_final_summary(extracted_data, field_counts=field_counts)
             
             return output_path
             
@@ -1732,8 +1940,9 @@ class Acres99Scraper:
                     self.driver.quit()
             except:
                 pass
+            self._detach_playwright()
 
-    def _print_final_summary(self, extracted_data: List[Dict]):
+    def _print_final_summary(self, extracted_data: List[Dict], field_counts: Dict):
         """Print comprehensive extraction summary"""
         logging.info("="*80)
         logging.info(" EXTRACTION COMPLETED")
@@ -1757,13 +1966,11 @@ class Acres99Scraper:
         logging.info(f"  • Processing time: {duration:.1f} minutes")
         
         if extracted_data:
-            # Analyze extraction quality
-            df = pd.DataFrame(extracted_data)
-            
-            price_count = len(df[df['price'].notna() & (df['price'] != '')])
-            nearby_count = len(df[df['nearby_places_count'] > 0])
-            avg_nearby = df['nearby_places_count'].mean()
-            building_name_count = len(df[df['building_name'].notna() & (df['building_name'] != '')])
+            # Analyze extraction quality, reusing the counts computed for the workbook
+            price_count = field_counts.get('price', 0)
+            building_name_count = field_counts.get('building_name', 0)
+            nearby_count = field_counts.get('nearby_places_count', 0)
+            avg_nearby = field_counts.get('avg_nearby_places', 0.0)
             
             logging.info(f"\n DATA QUALITY SUMMARY:")
             logging.info(f"  • Listings with price: {price_count}/{len(extracted_data)} ({price_count/len(extracted_data)*100:.1f}%)")
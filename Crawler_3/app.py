@@ -4,19 +4,23 @@ import sys
 import uuid
 import logging
 import argparse
+import importlib
 from datetime import datetime
 from configparser import ConfigParser
 
-from nobroker_scraper import NoBrokerScraper
-from magicbricks_scraper import MagicBricksScraper
-from acres_scraper import Acres99Scraper
-
 # Basic constants
 ROOT = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(ROOT, "config.ini")
 LOGS_DIR = os.path.join(ROOT, "logs")
 OUTPUT_DIR = os.path.join(ROOT, "output")
 
+# Scraper class per site; the module "<site>_scraper" is imported only when selected
+SCRAPER_CLASSES = {
+    "nobroker": "NoBrokerScraper",
+    "magicbricks": "MagicBricksScraper",
+    "acres": "Acres99Scraper",
+}
+
 os.makedirs(LOGS_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -40,7 +44,8 @@ def load_config(path):
 def main():
     parser = argparse.ArgumentParser(description="Run property scrapers")
     parser.add_argument("--config", default=CONFIG_PATH, help="Path to config.ini")
-    parser.add_argument("--site", choices=["nobroker", "magicbricks","acres"], required=True, help="Which site to scrape")
+    parser.add_argument("--site", choices=list(SCRAPER_CLASSES), required=True, help="Which site to scrape")
+    parser.add_argument("--no-wait", action="store_true", help="Skip the manual setup countdown (for CI/unattended runs)")
     args = parser.parse_args()
 
     # Run identifiers
@@ -54,17 +59,19 @@ def main():
 
     # Load config
     config = load_config(args.config)
+    if args.no_wait:
+        if not config.has_section("manual"):
+            config.add_section("manual")
+        config.set("manual", "selection_wait_time", "0")
 
     try:
-        if args.site == "nobroker":
-            scraper = NoBrokerScraper(config=config, run_id=run_id, start_ts=start_ts)
-        elif args.site == "magicbricks":
-            scraper = MagicBricksScraper(config=config, run_id=run_id, start_ts=start_ts)
-        elif args.site == "acres":
-            scraper = Acres99Scraper(config=config, run_id=run_id, start_ts=start_ts)
-        else:
+        if args.site not in SCRAPER_CLASSES:
             raise ValueError("Unsupported site")
 
+        module = importlib.import_module(f"{args.site}_scraper")
+        scraper_class = getattr(module, SCRAPER_CLASSES[args.site])
+        scraper = scraper_class(config=config, run_id=run_id, start_ts=start_ts)
+
         result = scraper.run()
         logging.info("Scraper result: %s", result.get("metrics", {}))
         logging.info("Output file: %s", result.get("output_path"))
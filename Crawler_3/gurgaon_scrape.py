@@ -5,14 +5,30 @@ for comprehensive Gurgaon property data extraction
 """
 
 import os
+import sys
 import time
 import logging
 import random
+import shutil
+import tempfile
+import threading
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import xlsxwriter
 from datetime import datetime
 import json
 from typing import List, Dict, Optional, Set
 import configparser
+import asyncio
+import atexit
+import importlib
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain, islice
+from urllib.parse import quote_plus
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -23,15 +39,270 @@ from selenium.common.exceptions import (
     TimeoutException, NoSuchElementException, ElementNotInteractableException
 )
 import undetected_chromedriver as uc
+from utils import enable_keep_alive, write_sheet_rows
 import re
 
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # Playwright is optional; discovery falls back to Selenium
+    async_playwright = None
+
+# Shared across worker processes to cap concurrent page loads against NoBroker
+_host_semaphore = None
+
+# Heavy resources that carry no listing text; blocked at the network layer via CDP.
+# Image URLs stay in the DOM (src attributes) so image-link extraction still works.
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm"
+]
+
+# Analytics and tracking endpoints; never needed for scraping, so always blocked
+TRACKER_DOMAINS = [
+    "google-analytics", "googletagmanager", "doubleclick", "facebook.net", "hotjar",
+    "segment.io", "clarity.ms", "mixpanel", "sentry", "newrelic"
+]
+TRACKER_URL_PATTERNS = [f"*{domain}*" for domain in TRACKER_DOMAINS]
+_TRACKER_RE = re.compile("|".join(re.escape(domain) for domain in TRACKER_DOMAINS))
+
+# Returns the trimmed, non-empty text of every element matching arguments[0]
+SUGGESTION_TEXTS_JS = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .map(el => (el.innerText || '').trim())
+    .filter(Boolean);
+"""
+
+# Returns the first selector in arguments[0] whose element is rendered, or null
+VISIBLE_SELECTOR_PROBE_JS = """
+for (const selector of arguments[0]) {
+    const el = document.querySelector(selector);
+    if (el && el.offsetParent !== null) return selector;
+}
+return null;
+"""
+
+# Locality-name cleanup patterns, compiled once for the per-suggestion hot loop
+_CITY_RE = re.compile(r'\b(?:Gurgaon|Gurugram)\b')
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_EDGE_SEPARATORS_RE = re.compile(r'^[,\-\s]+|[,\-\s]+$')
+
+# Per-process scraper that owns the persistent Chrome session reused across batches
+_worker_scraper = None
+
+# Queue to the parent's Parquet writer thread, set in each worker process
+_result_queue = None
+
+# Serializes Chrome launches across workers; undetected_chromedriver patches one shared
+# chromedriver binary on every launch, so concurrent launches race on that file
+_launch_lock = None
+
+
+# Search URLs longer than this may fail; fall back to the generic query URL
+_MAX_URL_LEN = 2000
+
+
+@lru_cache(maxsize=512)
+def _locality_param(locality: str) -> str:
+    """URL-encoded 'locality, Gurgaon' search parameter"""
+    return quote_plus(f"{locality}, Gurgaon")
+
+
+@lru_cache(maxsize=512)
+def _locality_slug(locality: str) -> str:
+    """Lowercased locality parameter used in NoBroker search paths"""
+    # quote_plus already turns spaces into '+', so no further replacement is needed
+    return _locality_param(locality).lower()
+
+
+def _load_config(config_dict: Dict) -> configparser.ConfigParser:
+    """Rebuild a ConfigParser from the plain dict sent to worker processes"""
+    config = configparser.ConfigParser()
+    config.read_dict(config_dict)
+    return config
+
+
+def _load_scraper_class(base_scraper_class_path: str):
+    """Resolve a 'module:ClassName' path to the scraper class"""
+    module_name, class_name = base_scraper_class_path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _block_heavy_resources(driver, patterns: List[str]):
+    """Stop Chrome from fetching resources matching the given URL patterns"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        logging.debug(f"Resource blocking unavailable: {e}")
+
+
+def _quit_worker_driver():
+    """Quit this process's persistent Chrome session, if any"""
+    global _worker_scraper
+    if _worker_scraper is None:
+        return
+    try:
+        if _worker_scraper.driver:
+            _worker_scraper.driver.quit()
+    except Exception as e:
+        logging.debug(f"Worker driver quit failed: {e}")
+    _worker_scraper = None
+
+
+def _get_worker_scraper(config, base_scraper_class_path: str):
+    """Return this process's driver-owning scraper, launching Chrome on first use"""
+    global _worker_scraper
+    if _worker_scraper is None:
+        scraper = _load_scraper_class(base_scraper_class_path)(
+            config=config, run_id=f"worker_{os.getpid()}", start_ts=datetime.now()
+        )
+        if _launch_lock is not None:
+            with _launch_lock:
+                scraper._setup_enhanced_webdriver()
+        else:
+            scraper._setup_enhanced_webdriver()
+        blocked_patterns = list(TRACKER_URL_PATTERNS)
+        if config.getboolean("automation", "block_resources", fallback=True):
+            blocked_patterns += BLOCKED_RESOURCE_PATTERNS
+        _block_heavy_resources(scraper.driver, blocked_patterns)
+        _worker_scraper = scraper
+        
+        # Pool workers leave via os._exit, which skips atexit; Finalize still runs there
+        atexit.register(_quit_worker_driver)
+        multiprocessing.util.Finalize(None, _quit_worker_driver, exitpriority=10)
+    return _worker_scraper
+
+
+def _init_worker(semaphore, result_queue, launch_lock, config_dict: Dict, base_scraper_class_path: str):
+    """Initialize a scraper worker process with the shared host semaphore, result queue and browser"""
+    global _host_semaphore, _result_queue, _launch_lock
+    _host_semaphore = semaphore
+    _result_queue = result_queue
+    _launch_lock = launch_lock
+    try:
+        _get_worker_scraper(_load_config(config_dict), base_scraper_class_path)
+    except Exception as e:
+        # Leave the pool usable; the first batch retries the launch
+        logging.error(f"Worker browser launch failed: {e}")
+
+
+def _scrape_batch(config_dict: Dict, base_scraper_class_path: str, run_id: str,
+                  batch_index: int, localities: List[str]) -> List[Dict]:
+    """Scrape a specific batch of localities inside a worker process"""
+    config = _load_config(config_dict)
+    base_scraper_class = _load_scraper_class(base_scraper_class_path)
+    
+    # Stagger batches within each worker to stay respectful to the site
+    if batch_index > 0:
+        delay = random.uniform(
+            config.getfloat("automation", "batch_delay_min", fallback=1),
+            config.getfloat("automation", "batch_delay_max", fallback=2)
+        )
+        logging.debug("Batch %d: waiting %.1fs before start...", batch_index + 1, delay)
+        time.sleep(delay)
+    
+    # Build search URL
+    search_url = AutomatedGurgaonScraper.build_search_url(localities)
+    logging.debug("Batch %d localities=%s url=%s", batch_index + 1, localities, search_url)
+    
+    # Initialize scraper instance
+    scraper = base_scraper_class(
+        config=config,
+        run_id=f"{run_id}_batch_{batch_index + 1}",
+        start_ts=datetime.now()
+    )
+    
+    # Run extraction
+    extracted_data = []
+    try:
+        # Reuse the worker's browser instead of cold-starting Chrome per batch
+        worker_scraper = _get_worker_scraper(config, base_scraper_class_path)
+        scraper.driver = worker_scraper.driver
+        scraper.wait = worker_scraper.wait
+        scraper.actions = worker_scraper.actions
+        scraper.driver.delete_all_cookies()
+        
+        if _host_semaphore is not None:
+            with _host_semaphore:
+                navigated = scraper.navigate_and_setup(search_url)
+        else:
+            navigated = scraper.navigate_and_setup(search_url)
+        
+        if navigated:
+            # Reduce manual wait time for automation
+            scraper.manual_wait_time = 3
+            
+            extracted_data = scraper.extract_all_listings()
+            
+            # Add locality batch info to each record, sharing one string object per batch
+            batch_tag = sys.intern(', '.join(localities))
+            url_tag = sys.intern(search_url)
+            for record in extracted_data:
+                record['locality_batch'] = batch_tag
+                record['batch_index'] = batch_index + 1
+                record['search_url'] = url_tag
+        
+    except Exception as extraction_e:
+        logging.error(f"Extraction failed for batch {batch_index + 1}: {extraction_e}")
+        # The session may be broken; relaunch Chrome for the next batch
+        _quit_worker_driver()
+    
+    return extracted_data
+
+
+def _scrape_batch_to_queue(config_dict: Dict, base_scraper_class_path: str, run_id: str,
+                           batch_index: int, localities: List[str]) -> int:
+    """Pool entry point: scrape a batch, hand its rows to the writer thread, return the row count"""
+    extracted_data = _scrape_batch(config_dict, base_scraper_class_path, run_id, batch_index, localities)
+    if extracted_data:
+        _result_queue.put(extracted_data)
+    return len(extracted_data)
+
+
 class GurgaonLocalityDiscoverer:
     """Class to discover and manage all Gurgaon localities for automated scraping"""
     
+    SEARCH_INPUT_SELECTORS = [
+        "input[placeholder*='locality']",
+        "input[placeholder*='city']", 
+        "input[placeholder*='area']",
+        "input[id*='location']",
+        "input[class*='search']",
+        ".search-input input"
+    ]
+    
+    SUGGESTION_SELECTORS = [
+        ".autocomplete-suggestion",
+        ".suggestion-item",
+        ".dropdown-item",
+        "[class*='suggestion']",
+        "[class*='dropdown'] li",
+        ".search-results li"
+    ]
+    
+    # Different search patterns to trigger autocomplete
+    SEARCH_PATTERNS = [
+        "Gurgaon Sector",
+        "Gurgaon DLF", 
+        "Gurgaon Phase",
+        "Gurgaon Udyog",
+        "Gurgaon Sohna",
+        "Gurgaon Golf",
+        "Gurgaon Palam",
+        "Gurgaon Manesar"
+    ]
+    
     def __init__(self, config):
         self.config = config
         self.driver = None
         self.wait = None
+        self.profile_dir = None
+        
+        # Discovery results change rarely; cache them between runs
+        self.cache_path = os.path.join(
+            config.get("output", "output_dir", fallback="automated_output"), "localities.cache.json"
+        )
+        self.cache_ttl_days = config.getfloat("automation", "localities_cache_days", fallback=7)
         
         # Comprehensive Gurgaon localities database
         self.known_localities = {
@@ -102,10 +373,40 @@ class GurgaonLocalityDiscoverer:
         """Setup Chrome WebDriver for locality discovery"""
         try:
             options = uc.ChromeOptions()
-            options.add_argument("--start-maximized")
             options.add_argument("--disable-blink-features=AutomationControlled")
             
+            # Headless, no extras: discovery never needs a visible or fully featured browser
+            options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-sync")
+            options.add_argument("--metrics-recording-only")
+            options.add_argument("--mute-audio")
+            options.add_argument("--window-size=1280,800")
+            # A fresh profile per launch, removed again when the browser quits
+            self.profile_dir = tempfile.mkdtemp(prefix="uc-")
+            options.add_argument(f"--user-data-dir={self.profile_dir}")
+            
+            # Return at DOMContentLoaded; discovery waits explicitly for the search input
+            options.page_load_strategy = "eager"
+            
+            # Discovery only reads suggestion text, so skip images, stylesheets and notifications
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            
             self.driver = uc.Chrome(options=options)
+            enable_keep_alive(self.driver)
+            _block_heavy_resources(self.driver, TRACKER_URL_PATTERNS + BLOCKED_RESOURCE_PATTERNS + ["*.css"])
+            
+            # Explicit waits only; an implicit wait would compound every poll
+            self.driver.implicitly_wait(0)
             self.wait = WebDriverWait(self.driver, 10)
             
             logging.info("Driver setup completed for locality discovery")
@@ -116,31 +417,82 @@ class GurgaonLocalityDiscoverer:
 
     def discover_localities_from_website(self) -> Set[str]:
         """Discover localities directly from NoBroker's autocomplete/suggestion system"""
+        if async_playwright is not None:
+            try:
+                return asyncio.run(self._discover_localities_async())
+            except Exception as e:
+                logging.warning(f"Playwright discovery failed, falling back to Selenium: {e}")
+        
+        return self._discover_localities_selenium()
+
+    async def _discover_localities_async(self) -> Set[str]:
+        """Probe all search patterns concurrently in headless Playwright pages"""
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                results = await asyncio.gather(
+                    *[self._probe_search_pattern(browser, pattern) for pattern in self.SEARCH_PATTERNS],
+                    return_exceptions=True
+                )
+            finally:
+                await browser.close()
+        
+        discovered = set()
+        for pattern, result in zip(self.SEARCH_PATTERNS, results):
+            if isinstance(result, Exception):
+                logging.debug(f"Search pattern '{pattern}' failed: {result}")
+                continue
+            discovered.update(result)
+        
+        logging.info(f"Discovered {len(discovered)} additional localities from website")
+        return discovered
+
+    async def _probe_search_pattern(self, browser, pattern: str) -> Set[str]:
+        """Type one search pattern into a fresh page and collect matching suggestions"""
+        page = await browser.new_page()
+        try:
+            # Suggestion text is all we need; skip heavy resources and trackers
+            await page.route(
+                "**/*",
+                lambda route: route.abort()
+                if route.request.resource_type in ("image", "stylesheet", "font", "media")
+                or _TRACKER_RE.search(route.request.url)
+                else route.continue_()
+            )
+            await page.goto("https://www.nobroker.in/", wait_until="domcontentloaded")
+            
+            search_input = page.locator(", ".join(self.SEARCH_INPUT_SELECTORS)).first
+            await search_input.fill(pattern, timeout=5000)
+            
+            suggestion_selector = ", ".join(self.SUGGESTION_SELECTORS)
+            await page.wait_for_selector(suggestion_selector, timeout=3000)
+            texts = await page.eval_on_selector_all(
+                suggestion_selector, "els => els.map(el => el.innerText.trim())"
+            )
+            
+            return self._localities_from_suggestions(texts)
+        
+        finally:
+            await page.close()
+
+    def _discover_localities_selenium(self) -> Set[str]:
+        """Discover localities from the autocomplete by typing into a Selenium-driven search box"""
         try:
             self.setup_driver()
             
             # Navigate to NoBroker search page
             self.driver.get("https://www.nobroker.in/")
-            time.sleep(3)
+            try:
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input")))
+            except TimeoutException:
+                logging.debug("No input element appeared on the search page")
             
             # Look for location search input
-            search_selectors = [
-                "input[placeholder*='locality']",
-                "input[placeholder*='city']", 
-                "input[placeholder*='area']",
-                "input[id*='location']",
-                "input[class*='search']",
-                ".search-input input"
-            ]
-            
+            # Probe every selector in one script call, then fetch the visible match once
             search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if search_input.is_displayed():
-                        break
-                except:
-                    continue
+            selector = self.driver.execute_script(VISIBLE_SELECTOR_PROBE_JS, self.SEARCH_INPUT_SELECTORS)
+            if selector:
+                search_input = self.driver.find_element(By.CSS_SELECTOR, selector)
             
             if not search_input:
                 logging.warning("Could not find search input, using predefined localities")
@@ -148,46 +500,23 @@ class GurgaonLocalityDiscoverer:
             
             discovered = set()
             
-            # Try different search patterns to trigger autocomplete
-            search_patterns = [
-                "Gurgaon Sector",
-                "Gurgaon DLF", 
-                "Gurgaon Phase",
-                "Gurgaon Udyog",
-                "Gurgaon Sohna",
-                "Gurgaon Golf",
-                "Gurgaon Palam",
-                "Gurgaon Manesar"
-            ]
-            
-            for pattern in search_patterns:
+            for pattern in self.SEARCH_PATTERNS:
                 try:
                     search_input.clear()
                     search_input.send_keys(pattern)
-                    time.sleep(2)
                     
-                    # Look for autocomplete suggestions
-                    suggestion_selectors = [
-                        ".autocomplete-suggestion",
-                        ".suggestion-item",
-                        ".dropdown-item",
-                        "[class*='suggestion']",
-                        "[class*='dropdown'] li",
-                        ".search-results li"
-                    ]
+                    # Wait only until the dropdown renders instead of a fixed sleep
+                    suggestion_selector = ", ".join(self.SUGGESTION_SELECTORS)
+                    try:
+                        WebDriverWait(self.driver, 3).until(
+                            lambda d: len(d.find_elements(By.CSS_SELECTOR, suggestion_selector)) > 0
+                        )
+                    except TimeoutException:
+                        continue
                     
-                    for selector in suggestion_selectors:
-                        try:
-                            suggestions = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for suggestion in suggestions:
-                                text = suggestion.text.strip()
-                                if "gurgaon" in text.lower() and len(text) > 5:
-                                    # Extract locality name
-                                    locality = self._extract_locality_name(text)
-                                    if locality:
-                                        discovered.add(locality)
-                        except:
-                            continue
+                    # Collect all suggestion texts in one round-trip
+                    texts = self.driver.execute_script(SUGGESTION_TEXTS_JS, suggestion_selector)
+                    discovered.update(self._localities_from_suggestions(texts or []))
                     
                 except Exception as e:
                     logging.debug(f"Search pattern '{pattern}' failed: {e}")
@@ -201,56 +530,98 @@ class GurgaonLocalityDiscoverer:
             return set()
         
         finally:
+            self.quit_driver()
+
+    def quit_driver(self):
+        """Quit the discovery browser and remove its temporary profile"""
+        try:
             if self.driver:
                 self.driver.quit()
+        except Exception as e:
+            logging.debug(f"Discovery driver quit failed: {e}")
+        self.driver = None
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
 
-    def _extract_locality_name(self, text: str) -> Optional[str]:
+    def _localities_from_suggestions(self, texts: List[str]) -> Set[str]:
+        """Turn raw autocomplete suggestion texts into clean Gurgaon locality names"""
+        discovered = set()
+        for text in texts:
+            if "gurgaon" in text.lower() and len(text) > 5:
+                locality = self._extract_locality_name(text)
+                if locality:
+                    discovered.add(locality)
+        return discovered
+
+    @staticmethod
+    def _extract_locality_name(text: str) -> Optional[str]:
         """Extract clean locality name from suggestion text"""
-        try:
-            # Remove common prefixes/suffixes
-            text = text.replace("Gurgaon", "").replace("Gurugram", "").strip()
-            text = re.sub(r'^[,\-\s]+|[,\-\s]+$', '', text)
-            
-            # Filter out too short or invalid names
-            if len(text) < 3 or text.isdigit():
-                return None
-            
-            # Remove parenthetical information
-            text = re.sub(r'\([^)]*\)', '', text).strip()
-            
-            return text if text else None
-            
-        except Exception:
+        # Drop city names and parenthetical information, then trim separators
+        text = _PAREN_RE.sub('', _CITY_RE.sub('', text))
+        text = _EDGE_SEPARATORS_RE.sub('', text)
+        
+        # Filter out too short or invalid names
+        if len(text) < 3 or text.isdigit():
             return None
+        
+        return text
 
     def get_all_localities(self) -> List[str]:
         """Get comprehensive list of all Gurgaon localities"""
         try:
-            # Start with known localities
-            all_localities = set(self.all_localities)
+            # Reuse a recent discovery run instead of relaunching the browser
+            cached = self._load_cached_localities()
+            if cached:
+                logging.info(f"Loaded {len(cached)} localities from cache: {self.cache_path}")
+                return cached
             
             # Add discovered localities from website
             discovered = self.discover_localities_from_website()
-            all_localities.update(discovered)
             
-            # Convert to sorted list for consistent processing
-            locality_list = sorted(list(all_localities))
+            # Dedupe while keeping known-list order, so neighbouring sectors share a batch
+            locality_list = list(dict.fromkeys(chain(self.all_localities, discovered)))
             
             logging.info(f"Total localities identified: {len(locality_list)}")
             
+            # A failed discovery leaves only the built-in list; don't let that stand in
+            # for a real discovery run until the cache expires
+            if discovered:
+                self._save_cached_localities(locality_list)
+            else:
+                logging.warning("Locality discovery found nothing; not caching the built-in list")
             return locality_list
             
         except Exception as e:
             logging.error(f"Failed to get all localities: {e}")
             return self.all_localities
 
+    def _load_cached_localities(self) -> Optional[List[str]]:
+        """Return cached localities if the cache file is younger than the TTL"""
+        try:
+            if not os.path.exists(self.cache_path):
+                return None
+            if os.path.getmtime(self.cache_path) < time.time() - self.cache_ttl_days * 86400:
+                return None
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logging.debug(f"Locality cache unreadable: {e}")
+            return None
+
+    def _save_cached_localities(self, localities: List[str]):
+        """Write the locality list to the on-disk cache"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(localities, f, ensure_ascii=False)
+        except Exception as e:
+            logging.debug(f"Locality cache write failed: {e}")
+
     def create_locality_batches(self, localities: List[str], batch_size: int = 3) -> List[List[str]]:
         """Create batches of localities for NoBroker's 3-locality limit"""
-        batches = []
-        
-        for i in range(0, len(localities), batch_size):
-            batch = localities[i:i + batch_size]
-            batches.append(batch)
+        iterator = iter(localities)
+        batches = list(iter(lambda: list(islice(iterator, batch_size)), []))
         
         logging.info(f"Created {len(batches)} batches from {len(localities)} localities")
         return batches
@@ -262,10 +633,13 @@ class AutomatedGurgaonScraper:
     def __init__(self, config, base_scraper_class):
         self.config = config
         self.base_scraper_class = base_scraper_class
+        self.base_scraper_class_path = f"{base_scraper_class.__module__}:{base_scraper_class.__qualname__}"
         self.locality_discoverer = GurgaonLocalityDiscoverer(config)
         
-        # Tracking
-        self.all_extracted_data = []
+        # Tracking; rows live in the Parquet checkpoint, not in memory
+        self.row_count = 0
+        self._results_df = None
+        self._price_count = None
         self.processing_stats = {
             "total_localities": 0,
             "successful_localities": 0,
@@ -279,30 +653,44 @@ class AutomatedGurgaonScraper:
         os.makedirs(self.output_dir, exist_ok=True)
         
         self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Intermediate checkpoint: each finished batch is appended, never rewritten
+        self.intermediate_path = os.path.join(
+            self.output_dir, f"gurgaon_automated_intermediate_{self.run_id}.parquet"
+        )
+        self._pq_writer = None
+        # Parquet files written so far; a batch that widens the schema starts a new part
+        self._pq_parts = []
+        # Batches the checkpoint could not take (e.g. a disk error) stay in memory
+        self._unwritten_records = []
+        
+        # Parallel batch processing
+        self.workers = config.getint("automation", "workers", fallback=4)
+        self.max_concurrent_requests = config.getint("automation", "max_concurrent_requests", fallback=2)
 
-    def build_search_url(self, localities: List[str], property_type: str = "1bhk", transaction_type: str = "sale") -> str:
+    @staticmethod
+    def build_search_url(localities: List[str], property_type: str = "1bhk", transaction_type: str = "sale") -> str:
         """Build NoBroker search URL with specific localities"""
+        return AutomatedGurgaonScraper._build_url(tuple(localities), property_type, transaction_type)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _build_url(localities: tuple, property_type: str, transaction_type: str) -> str:
+        """Memoized URL builder keyed by the locality tuple, so batch retries skip the rebuild"""
         try:
             base_url = "https://www.nobroker.in"
             
-            # URL encode localities
-            from urllib.parse import quote_plus
-            locality_params = []
-            
-            for locality in localities:
-                encoded_locality = quote_plus(f"{locality}, Gurgaon")
-                locality_params.append(encoded_locality)
-            
-            # Create search URL
-            locality_string = ",".join(locality_params)
+            # Create search URL from cached per-locality slugs
+            slug_string = ",".join(_locality_slug(locality) for locality in localities)
             
             if transaction_type.lower() == "sale":
-                url = f"{base_url}/{property_type}-flats-for-sale-in-{locality_string.lower().replace(' ', '-')}"
+                url = f"{base_url}/{property_type}-flats-for-sale-in-{slug_string}"
             else:
-                url = f"{base_url}/{property_type}-flats-for-rent-in-{locality_string.lower().replace(' ', '-')}"
+                url = f"{base_url}/{property_type}-flats-for-rent-in-{slug_string}"
             
             # Fallback to general search if URL construction fails
-            if len(url) > 2000:  # URLs too long may fail
+            if len(url) > _MAX_URL_LEN:
+                locality_string = ",".join(_locality_param(locality) for locality in localities)
                 return f"{base_url}/property/{transaction_type}/gurgaon?searchParam={locality_string[:100]}"
             
             return url
@@ -312,57 +700,28 @@ class AutomatedGurgaonScraper:
             # Fallback URL
             return "https://www.nobroker.in/property/sale/gurgaon"
 
+    def _config_dict(self) -> Dict[str, Dict[str, str]]:
+        """Convert the config into a plain dict that can be sent to worker processes"""
+        return {section: dict(self.config[section]) for section in self.config.sections()}
+
+    def _record_batch_result(self, localities: List[str], batch_index: int, listing_count: int):
+        """Update processing stats with the outcome of one batch"""
+        if listing_count:
+            self.processing_stats["successful_localities"] += len(localities)
+            self.processing_stats["total_listings"] += listing_count
+            logging.info("Batch %d completed: %d listings extracted", batch_index + 1, listing_count)
+        else:
+            self.processing_stats["failed_localities"] += len(localities)
+            logging.warning("Batch %d failed: No data extracted", batch_index + 1)
+
     def scrape_locality_batch(self, localities: List[str], batch_index: int) -> List[Dict]:
         """Scrape a specific batch of localities"""
         try:
-            logging.info(f"Starting batch {batch_index + 1}: {localities}")
-            
-            # Build search URL
-            search_url = self.build_search_url(localities)
-            logging.info(f"Search URL: {search_url}")
-            
-            # Initialize scraper instance
-            scraper = self.base_scraper_class(
-                config=self.config,
-                run_id=f"{self.run_id}_batch_{batch_index + 1}",
-                start_ts=datetime.now()
+            extracted_data = _scrape_batch(
+                self._config_dict(), self.base_scraper_class_path, self.run_id, batch_index, localities
             )
-            
-            # Run extraction
-            extracted_data = []
-            try:
-                scraper._setup_enhanced_webdriver()
-                
-                if scraper.navigate_and_setup(search_url):
-                    # Reduce manual wait time for automation
-                    scraper.manual_wait_time = 3
-                    
-                    extracted_data = scraper.extract_all_listings()
-                    
-                    # Add locality batch info to each record
-                    for record in extracted_data:
-                        record['locality_batch'] = ', '.join(localities)
-                        record['batch_index'] = batch_index + 1
-                        record['search_url'] = search_url
-                
-            except Exception as extraction_e:
-                logging.error(f"Extraction failed for batch {batch_index + 1}: {extraction_e}")
-                
-            finally:
-                try:
-                    if scraper.driver:
-                        scraper.driver.quit()
-                except:
-                    pass
-            
-            if extracted_data:
-                self.processing_stats["successful_localities"] += len(localities)
-                self.processing_stats["total_listings"] += len(extracted_data)
-                logging.info(f"Batch {batch_index + 1} completed: {len(extracted_data)} listings extracted")
-            else:
-                self.processing_stats["failed_localities"] += len(localities)
-                logging.warning(f"Batch {batch_index + 1} failed: No data extracted")
-            
+            self._write_results(extracted_data)
+            self._record_batch_result(localities, batch_index, len(extracted_data))
             return extracted_data
             
         except Exception as e:
@@ -384,39 +743,55 @@ class AutomatedGurgaonScraper:
             
             logging.info(f"Will process {len(locality_batches)} batches covering {len(all_localities)} localities")
             
-            # Process each batch
-            for batch_index, batch_localities in enumerate(locality_batches):
-                try:
-                    logging.info(f"\n{'='*60}")
-                    logging.info(f"Processing Batch {batch_index + 1}/{len(locality_batches)}")
-                    logging.info(f"Localities: {batch_localities}")
-                    logging.info(f"{'='*60}")
-                    
-                    batch_data = self.scrape_locality_batch(batch_localities, batch_index)
-                    
-                    if batch_data:
-                        self.all_extracted_data.extend(batch_data)
-                        
-                        # Save intermediate results every 5 batches
-                        if (batch_index + 1) % 5 == 0:
-                            self._save_intermediate_results(batch_index + 1)
-                    
-                    # Delay between batches to be respectful
-                    if batch_index < len(locality_batches) - 1:
-                        delay = random.uniform(5, 10)
-                        logging.info(f"Waiting {delay:.1f}s before next batch...")
-                        time.sleep(delay)
+            # Process batches in parallel worker processes, streaming results as they finish
+            config_dict = self._config_dict()
+            semaphore = multiprocessing.BoundedSemaphore(self.max_concurrent_requests)
+            completed_batches = 0
+            
+            # Workers push finished batches to a single writer thread that appends them to Parquet
+            result_queue = multiprocessing.Queue(maxsize=16)
+            writer_thread = threading.Thread(
+                target=self._parquet_writer_loop, args=(result_queue,), daemon=True
+            )
+            writer_thread.start()
+            
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(semaphore, result_queue, multiprocessing.Lock(), config_dict, self.base_scraper_class_path)
+            )
+            try:
+                futures = {
+                    executor.submit(
+                        _scrape_batch_to_queue, config_dict, self.base_scraper_class_path,
+                        self.run_id, batch_index, batch_localities
+                    ): (batch_index, batch_localities)
+                    for batch_index, batch_localities in enumerate(locality_batches)
+                }
                 
-                except KeyboardInterrupt:
-                    logging.info("User interrupted scraping")
-                    break
+                for future in as_completed(futures):
+                    batch_index, batch_localities = futures[future]
+                    try:
+                        listing_count = future.result()
+                    except Exception as batch_e:
+                        logging.error(f"Batch {batch_index + 1} failed: {batch_e}")
+                        listing_count = 0
                     
-                except Exception as batch_e:
-                    logging.error(f"Batch {batch_index + 1} failed: {batch_e}")
-                    continue
+                    self._record_batch_result(batch_localities, batch_index, listing_count)
+                    completed_batches += 1
+                    logging.debug("Processed %d/%d batches", completed_batches, len(locality_batches))
+            
+            except KeyboardInterrupt:
+                logging.info("User interrupted scraping")
+            
+            finally:
+                # Wait for the workers to exit: that flushes their queue feeder threads,
+                # so every batch is in the pipe ahead of the sentinel
+                executor.shutdown(wait=True, cancel_futures=True)
+                result_queue.put(None)
+                writer_thread.join()
             
             # Save final results
-            if self.all_extracted_data:
+            if self.row_count:
                 output_path = self._save_final_results()
                 self._print_automation_summary()
                 return output_path
@@ -428,44 +803,123 @@ class AutomatedGurgaonScraper:
             logging.error(f"Automated scraping failed: {e}")
             return None
 
-    def _save_intermediate_results(self, batch_count: int):
-        """Save intermediate results during processing"""
+    def _parquet_writer_loop(self, result_queue):
+        """Drain batches from the worker queue into the Parquet checkpoint until a None sentinel"""
+        while True:
+            batch = result_queue.get()
+            if batch is None:
+                break
+            self._write_results(batch)
+
+    def _write_results(self, records: List[Dict]):
+        """Append one batch of records to the intermediate Parquet file"""
         try:
-            if not self.all_extracted_data:
+            if not records:
                 return
             
-            df = pd.DataFrame(self.all_extracted_data)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"gurgaon_automated_intermediate_batch{batch_count}_{timestamp}.xlsx"
-            filepath = os.path.join(self.output_dir, filename)
+            table = pa.Table.from_pylist(records)
+            schema = table.schema
+            if self._pq_writer is not None:
+                # All-None columns infer as null and new keys appear later; promote to cover both
+                try:
+                    schema = pa.unify_schemas([self._pq_writer.schema, schema], promote_options="permissive")
+                except pa.ArrowTypeError:
+                    pass  # incompatible types; the batch gets a part of its own
             
-            df.to_excel(filepath, index=False)
-            logging.info(f"Intermediate results saved: {filepath}")
+            # A Parquet file has one schema, so a changed schema rolls over to a new part
+            if self._pq_writer is None or not schema.equals(self._pq_writer.schema):
+                self._open_parquet_part(schema)
+            if not table.schema.equals(schema):
+                table = pa.Table.from_pylist(records, schema=schema)
+            
+            self._pq_writer.write_table(table)
+            self.row_count += len(records)
+            logging.debug("Intermediate results appended (%d rows): %s", self.row_count, self.intermediate_path)
             
         except Exception as e:
-            logging.error(f"Failed to save intermediate results: {e}")
+            logging.error(f"Failed to save intermediate results, keeping batch in memory: {e}")
+            self._unwritten_records.extend(records)
+            self.row_count += len(records)
+
+    def _open_parquet_part(self, schema: pa.Schema):
+        """Close the current Parquet part and start the next one with the given schema"""
+        if self._pq_writer is not None:
+            self._pq_writer.close()
+            self._pq_writer = None
+        root, ext = os.path.splitext(self.intermediate_path)
+        path = self.intermediate_path if not self._pq_parts else f"{root}_part{len(self._pq_parts) + 1}{ext}"
+        self._pq_writer = pq.ParquetWriter(path, schema)
+        self._pq_parts.append(path)
+        if len(self._pq_parts) > 1:
+            logging.debug("Intermediate schema changed; continuing in %s", path)
+
+    def _load_results_frame(self) -> pd.DataFrame:
+        """Close the Parquet checkpoint and read it back as the results DataFrame"""
+        if self._results_df is None:
+            frames = []
+            if self._pq_writer is not None:
+                self._pq_writer.close()
+                self._pq_writer = None
+            if self._pq_parts:
+                # Batch-level columns repeat per row; read them as categoricals, not per-row strings
+                tables = [
+                    pq.read_table(path, read_dictionary=["locality_batch", "search_url"])
+                    for path in self._pq_parts
+                ]
+                try:
+                    frames.append(pa.concat_tables(tables, promote_options="permissive").to_pandas())
+                except (pa.ArrowTypeError, pa.ArrowInvalid):
+                    frames.extend(table.to_pandas() for table in tables)
+            if self._unwritten_records:
+                frames.append(pd.DataFrame(self._unwritten_records))
+            self._results_df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            
+            # Arrow-backed strings make the empty/missing price checks vectorized kernels
+            if 'price' in self._results_df.columns:
+                self._results_df['price'] = self._results_df['price'].astype('string[pyarrow]')
+        return self._results_df
+
+    def _count_with_price(self, df: pd.DataFrame) -> int:
+        """Number of rows with a non-empty price, computed once and shared by the reports"""
+        if self._price_count is None:
+            self._price_count = int(df['price'].str.len().fillna(0).gt(0).sum())
+        return self._price_count
 
     def _save_final_results(self) -> str:
         """Save final comprehensive results with analysis"""
         try:
-            df = pd.DataFrame(self.all_extracted_data)
+            df = self._load_results_frame()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"gurgaon_1bhk_automated_complete_{timestamp}.xlsx"
             filepath = os.path.join(self.output_dir, filename)
             
-            with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
+            # Stream every sheet row by row; constant_memory keeps only the current row in RAM
+            with xlsxwriter.Workbook(filepath, {
+                "constant_memory": True,
+                "strings_to_formulas": False,
+                "strings_to_urls": False
+            }) as workbook:
                 # Main data
-                df.to_excel(writer, sheet_name="All_Properties", index=False)
+                write_sheet_rows(
+                    workbook, "All_Properties", list(df.columns), df.itertuples(index=False, name=None)
+                )
                 
                 # Locality-wise summary
                 if 'locality_batch' in df.columns:
-                    locality_summary = df.groupby('locality_batch').agg({
-                        'listing_index': 'count',
-                        'price': lambda x: x.notna().sum(),
-                        'nearby_places_count': 'mean'
-                    }).round(2)
-                    locality_summary.columns = ['Total_Listings', 'With_Price', 'Avg_Nearby_Places']
-                    locality_summary.to_excel(writer, sheet_name="Locality_Summary")
+                    # Native reducers only; a categorical key keeps group hashing cheap
+                    summary_source = df[['listing_index', 'nearby_places_count']].assign(
+                        locality_batch=df['locality_batch'].astype('category'),
+                        has_price=df['price'].notna().astype('int8')
+                    )
+                    locality_summary = summary_source.groupby('locality_batch', sort=False, observed=True).agg(
+                        Total_Listings=('listing_index', 'count'),
+                        With_Price=('has_price', 'sum'),
+                        Avg_Nearby_Places=('nearby_places_count', 'mean')
+                    ).round(2)
+                    write_sheet_rows(
+                        workbook, "Locality_Summary", ["locality_batch"] + list(locality_summary.columns),
+                        locality_summary.itertuples(index=True, name=None)
+                    )
                 
                 # Automation statistics
                 stats_data = {
@@ -484,15 +938,16 @@ class AutomatedGurgaonScraper:
                         self.processing_stats["successful_localities"],
                         self.processing_stats["failed_localities"],
                         len(df),
-                        len(df[df['price'].notna() & (df['price'] != '')]),
+                        self._count_with_price(df),
                         f"{(datetime.now() - self.processing_stats['start_time']).total_seconds() / 3600:.2f}",
                         f"{len(df) / max(1, self.processing_stats['successful_localities']):.1f}",
                         f"{(self.processing_stats['successful_localities'] / max(1, self.processing_stats['total_localities'])) * 100:.1f}"
                     ]
                 }
                 
-                stats_df = pd.DataFrame(stats_data)
-                stats_df.to_excel(writer, sheet_name="Automation_Stats", index=False)
+                write_sheet_rows(
+                    workbook, "Automation_Stats", list(stats_data), zip(*stats_data.values())
+                )
             
             logging.info(f"Final results saved: {filepath}")
             return filepath
@@ -521,9 +976,9 @@ class AutomatedGurgaonScraper:
         print(f"\n📊 EXTRACTION RESULTS:")
         print(f"  • Total properties found: {self.processing_stats['total_listings']}")
         
-        if self.all_extracted_data:
-            df = pd.DataFrame(self.all_extracted_data)
-            price_count = len(df[df['price'].notna() & (df['price'] != '')])
+        if self.row_count:
+            df = self._load_results_frame()
+            price_count = self._count_with_price(df)
             print(f"  • Properties with price info: {price_count}/{len(df)} ({price_count/len(df)*100:.1f}%)")
             
             if 'locality_batch' in df.columns:
@@ -565,9 +1020,13 @@ def create_automated_config():
     
     config["automation"] = {
         "batch_size": "3",  # NoBroker's locality limit
-        "batch_delay_min": "5",
-        "batch_delay_max": "10",
-        "intermediate_save_frequency": "5"
+        "batch_delay_min": "1",
+        "batch_delay_max": "2",
+        "intermediate_save_frequency": "5",
+        "workers": "4",  # Parallel Chrome worker processes
+        "max_concurrent_requests": "2",  # Cap on simultaneous page loads against NoBroker
+        "block_resources": "true",  # Skip images, fonts and media in batch browsers
+        "localities_cache_days": "7"  # Reuse discovered localities for this long
     }
     
     return config
@@ -575,9 +1034,13 @@ def create_automated_config():
 
 def main_automated():
     """Main function for automated Gurgaon-wide scraping"""
+    log_format = "%(asctime)s [%(levelname)s] %(message)s"
+    
+    # Unbuffered on purpose: forked pool workers would inherit and re-emit a parent's
+    # pending buffer, and their own buffered records would be lost at worker exit
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
+        format=log_format,
         handlers=[
             logging.StreamHandler(),
             logging.FileHandler("automated_gurgaon_scraper.log")
@@ -590,9 +1053,9 @@ def main_automated():
     print("🔄 AUTOMATION FEATURES:")
     print("  • Discovers all Gurgaon localities automatically")
     print("  • Processes localities in batches of 3 (NoBroker limit)")
-    print("  • Sequential scraping across all areas")
+    print("  • Parallel scraping across all areas with worker processes")
     print("  • Comprehensive coverage of sectors and named areas")
-    print("  • Automatic intermediate saves every 5 batches")
+    print("  • Streams every finished batch to a Parquet checkpoint")
     print("  • Handles failures gracefully and continues")
     print("=" * 80)
     
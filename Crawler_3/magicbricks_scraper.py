@@ -1,8 +1,16 @@
 import os
 import time
+import shutil
+import itertools
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
 import logging
 import random
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,7 +18,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 import re
-from bs4 import BeautifulSoup
+import csv
 import json
 from urllib.parse import urljoin, urlparse
 import configparser
@@ -19,79 +27,573 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import cv2
 import numpy as np
 import requests
-from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, Future
 import pytesseract
 import base64
-from io import BytesIO
+
+try:
+    from tesserocr import PyTessBaseAPI, PSM
+except ImportError:  # tesserocr is optional; OCR falls back to the pytesseract CLI wrapper
+    PyTessBaseAPI = None
+
+try:
+    from paddleocr import PaddleOCR
+except ImportError:  # PaddleOCR is optional; selected with [image_processing] ocr_engine = paddle
+    PaddleOCR = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON output falls back to the stdlib encoder
+    orjson = None
+
+MAX_IMAGE_BYTES = 5_000_000
+IMAGE_CACHE_SIZE = 2048
+MIN_ANALYSIS_PIXELS = 64 * 64
+# Outcomes of a URL analysis; skipped thumbnails are cached like results, failures are retried
+ANALYSIS_OK, ANALYSIS_SKIPPED, ANALYSIS_FAILED = 'ok', 'skipped', 'failed'
+OCR_MAX_DIM = 1500
+OCR_TIMEOUT = 10
+# Many download threads may reach inline OCR at once, and each Tesseract process runs up
+# to 4 OpenMP threads; cap concurrent processes so they don't oversubscribe the cores
+TESSERACT_SLOTS = threading.BoundedSemaphore(max(1, (os.cpu_count() or 1) // 4))
+
+OCR_WHITELIST = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ₹.,/-'
+# --oem 3 is Tesseract's default; psm 6 stays because it skips page layout analysis
+OCR_CONFIG = f'--psm 6 -c tessedit_char_whitelist={OCR_WHITELIST}'
+
+
+CARD_SELECTOR = "div.mb-srp__card, div.listingCard, .srpCard"
+
+# Return the card count and only the cards past those already processed, so each
+# scroll transfers element references for the new cards instead of the whole list
+NEW_CARDS_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+return [cards.length, Array.prototype.slice.call(cards, arguments[1])];
+"""
+
+# Per-field CSS selectors, tried in order; the first non-empty match wins
+FIELD_SELECTORS = {
+    'title': ['.mb-srp__card__title', '.cardTitle', 'h2', 'h3', '.title', '[data-testid*="title"]'],
+    'price': ['.mb-srp__card__price', '.price', '.priceValue', '[data-testid*="price"]'],
+    'locality': ['.mb-srp__card__summary__locality', '.locality', '.location', '[data-testid*="locality"]'],
+    'society_name': ['.societyName', '.projectName', '.buildingName', 'a[href*="project"]'],
+    'configuration': ['.mb-srp__card__summary__config', '.configuration', '.bhk', '[data-testid*="config"]'],
+    'property_type': ['.propertyType', '.apartmentType', '[data-testid*="type"]'],
+    'transaction_type': ['.mb-srp__card__badge', '.transaction', '[data-testid*="transaction"]'],
+    'status': ['.status', '.availability', '[data-testid*="status"]'],
+    'furnishing': ['.furnishing', '.furnished', '[data-testid*="furnish"]'],
+    'posted_date': ['.postedOn', '.postedDate', '[data-testid*="date"]'],
+    'owner_type': ['.ownerType', '.postedBy', '[data-testid*="owner"]'],
+    'contact_info': ['.contact', '.phone', '.mobile', '[data-testid*="contact"]'],
+    'facing': ['.facing', '[data-testid*="facing"]'],
+    'age_of_property': ['.age', '.construction', '[data-testid*="age"]'],
+    'balconies': ['.balcony', '[data-testid*="balcon"]'],
+    'floor_details': ['.floor', '.floorInfo', '[data-testid*="floor"]']
+}
+
+# Collect visible, enabled expandable elements in selector order, each element once
+EXPANDABLE_PROBE_JS = """
+var card = arguments[0], selectors = arguments[1], seen = new Set(), out = [];
+selectors.forEach(function(selector) {
+    card.querySelectorAll(selector).forEach(function(el) {
+        if (seen.has(el)) return;
+        seen.add(el);
+        var style = window.getComputedStyle(el);
+        if (el.getClientRects().length && style.visibility !== 'hidden' && !el.disabled) {
+            out.push([selector, el]);
+        }
+    });
+});
+return out;
+"""
+
+IMAGE_URL_ATTRIBUTES = ['src', 'data-src', 'data-original', 'data-lazy', 'data-srcset']
+
+AMENITY_SELECTORS = [
+    '.amenities', '.facilities', '.features', '.highlights',
+    '[class*="amenity"]', '[class*="feature"]', '[class*="facility"]',
+    '.nearby', '.location-advantages'
+]
+
+# Keyword categories, checked in order; each is one compiled scan instead of a substring test per word
+AMENITY_CATEGORIES = [
+    ('amenities', re.compile(r'gym|pool|park|security', re.IGNORECASE)),
+    ('nearby_facilities', re.compile(r'metro|school|hospital|mall', re.IGNORECASE)),
+    ('highlights', re.compile(r'premium|luxury|spacious', re.IGNORECASE)),
+]
+
+LINK_CATEGORIES = [
+    ('property_detail_url', re.compile(r'propertydetail|property-for-', re.IGNORECASE)),
+    ('society_url', re.compile(r'project|society', re.IGNORECASE)),
+    ('builder_url', re.compile(r'builder', re.IGNORECASE)),
+    ('contact_links', re.compile(r'contact|phone|call', re.IGNORECASE)),
+    ('social_links', re.compile(r'facebook|twitter|instagram', re.IGNORECASE)),
+]
+
+# Column order for the final output
+PREFERRED_COLUMNS = [
+    'card_number', 'extraction_timestamp', 'title', 'price', 'locality', 'society_name',
+    'configuration', 'property_type', 'transaction_type', 'status', 
+    'super_area', 'carpet_area', 'built_up_area', 'plot_area',
+    'images_count', 'has_images', 'primary_image_url',
+    'property_detail_url', 'society_url', 'total_links_count',
+    'furnishing', 'bathrooms', 'parking', 'balconies', 'floor_info',
+    'posted_date', 'owner_type', 'amenities', 'features',
+    'extraction_completeness', 'full_card_text'
+]
+
+# Every key a row is known to carry; the CSV backup header starts from this so later
+# batches rarely add columns (when they do, the backup is rewritten with a wider header)
+BACKUP_COLUMNS = list(dict.fromkeys(
+    PREFERRED_COLUMNS + list(FIELD_SELECTORS)
+    + ['all_image_urls', 'image_quality_scores', 'extracted_image_text', 'dominant_colors', 'image_types']
+    + [name for name, _ in AMENITY_CATEGORIES] + [name for name, _ in LINK_CATEGORIES]
+    + ['extraction_error']
+))
+
+# Everything the card extractors read from the DOM, gathered in one round trip
+CARD_JS = """
+var card = arguments[0], attributes = arguments[1], amenitySelectors = arguments[2], fieldSelectors = arguments[3];
+var fields = {};
+for (var field in fieldSelectors) {
+    var selectors = fieldSelectors[field];
+    for (var i = 0; i < selectors.length; i++) {
+        var el = card.querySelector(selectors[i]);
+        var text = el ? (el.innerText || '').trim() : '';
+        if (text) { fields[field] = text; break; }
+    }
+}
+var imgs = Array.from(card.querySelectorAll('img')).map(function(img) {
+    return attributes.map(function(attr) { return attr === 'src' ? img.src : img.getAttribute(attr); });
+});
+var bgs = [];
+card.querySelectorAll('*').forEach(function(el) {
+    var bgImage = window.getComputedStyle(el).backgroundImage;
+    if (bgImage && bgImage !== 'none' && bgImage.includes('url(')) {
+        var url = bgImage.match(/url\\(["']?([^"'\\)]+)["']?\\)/);
+        if (url && url[1] && !url[1].startsWith('data:')) {
+            bgs.push(url[1]);
+        }
+    }
+});
+var amenities = [];
+amenitySelectors.forEach(function(selector) {
+    card.querySelectorAll(selector).forEach(function(el) {
+        // Like WebElement.text, elements that are not rendered contribute no text
+        amenities.push(el.getClientRects().length ? (el.innerText || '').trim() : '');
+    });
+});
+var links = Array.from(card.querySelectorAll('a')).map(function(a) { return a.href; });
+return {text: card.innerText, fields: fields, imgs: imgs, bgs: Array.from(new Set(bgs)), amenities: amenities, links: links};
+"""
+
+def _json_dumps(value, indent=False):
+    """Serialize to JSON text with orjson when available, else the stdlib encoder"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:  # non-str keys or types orjson rejects; let stdlib handle them
+            pass
+    # Match orjson's output: compact separators unless indenting
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None,
+                      separators=(',', ': ') if indent else (',', ':'), default=str)
+
+
+SITE_ROOT = 'https://www.magicbricks.com/'
+
+
+def _absolutize(url):
+    """Resolve a card URL against the site root; absolute URLs are returned as-is"""
+    if url.startswith(('https://', 'http://')):
+        return url
+    # urljoin also covers protocol-relative (//cdn...) and dot-relative paths
+    return urljoin(SITE_ROOT, url)
+
+
+_COLOR_NAMES = ['white', 'black', 'red', 'green', 'blue', 'yellow', 'brown']
+
+
+def _classify_colors_vec(colors):
+    """Name an (N, 3) array of RGB colors at once; rules apply in order, first match wins"""
+    colors = np.asarray(colors, dtype=np.int16).reshape(-1, 3)
+    r, g, b = colors[:, 0], colors[:, 1], colors[:, 2]
+    conditions = [
+        (colors > 200).all(axis=1),
+        (colors < 50).all(axis=1),
+        (r > g) & (r > b),
+        (g > r) & (g > b),
+        (b > r) & (b > g),
+        (r > 150) & (g > 150),
+        (r > 100) & (g < 100) & (b < 100),
+    ]
+    return np.select(conditions, _COLOR_NAMES, default='mixed')
+
+
+class TokenBucket:
+    """Rate limiter that only sleeps when work outpaces the configured rate"""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping just long enough for it to refill if the bucket is empty"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+            # Tokens may go negative so concurrent callers queue behind each other
+            self.tokens -= 1
+        if wait > 0:
+            time.sleep(wait + random.uniform(0, 0.1 / self.rate))
 
 
 class ImageProcessor:
     """Advanced image processing for property listings"""
     
-    def __init__(self, config):
+    def __init__(self, config, ocr_stage_dir=None):
         self.config = config
         self.enable_ocr = config.getboolean("image_processing", "enable_ocr", fallback=False)
         self.download_images = config.getboolean("image_processing", "download_images", fallback=False)
         self.image_analysis = config.getboolean("image_processing", "analyze_images", fallback=False)
+        self.analyze_colors = config.getboolean("image_processing", "analyze_colors", fallback=True)
+        
+        # Pooled keep-alive session so image fetches reuse TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        
+        # Image analysis is dominated by download wait, so fan it out over threads
+        self.max_workers = config.getint("image_processing", "download_workers", fallback=16)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
         
+        # When a stage dir is given, OCR inputs are written there and read in one Tesseract run;
+        # the dir is created with the first staged image
+        self.ocr_stage_dir = ocr_stage_dir
+        self._ocr_counter = itertools.count()
+        
+        # Persistent OCR models (tesserocr or PaddleOCR), created on first use; neither is thread-safe
+        self.ocr_engine = config.get("image_processing", "ocr_engine", fallback="tesseract").lower()
+        self.ocr_use_gpu = config.getboolean("image_processing", "ocr_use_gpu", fallback=False)
+        self.ocr_enable_mkldnn = config.getboolean("image_processing", "ocr_enable_mkldnn", fallback=True)
+        self._tess = None
+        self._paddle = None
+        self._ocr_lock = threading.Lock()
+        
+        # Stock photos repeat across cards; remember per-URL analyses (as futures, so
+        # concurrent requests for the same URL share one download)
+        self._url_cache = OrderedDict()
+        self._url_cache_lock = threading.Lock()
+        
+        # The same photo is often served under several URLs; also key results by content hash
+        self._content_cache = OrderedDict()
+        
+    def close(self):
+        """Release the download pool and the OCR handle"""
+        self.executor.shutdown(wait=False)
+        with self._ocr_lock:
+            if self._tess:
+                self._tess.End()
+            self._tess = None
+            self._paddle = None
+    
+    def _get_ocr_engine(self):
+        """Return a persistent in-process OCR callable, or None when only pytesseract is usable; call under _ocr_lock"""
+        if self.ocr_engine == 'paddle':
+            paddle = self._get_paddle()
+            if paddle is not None:
+                return lambda source: self._paddle_text(paddle.ocr(source, cls=False))
+        if self._get_tess() is not None:
+            return self._tess_read
+        return None
+    
+    def _get_paddle(self):
+        """Return the shared PaddleOCR model, loading it on first use (on the GPU when enabled)"""
+        if self._paddle is None and PaddleOCR is not None:
+            # Fastest backend first: GPU, then oneDNN (int8/VNNI-capable) CPU kernels, then plain CPU
+            attempts = []
+            if self.ocr_use_gpu:
+                attempts.append({'use_gpu': True})
+            if self.ocr_enable_mkldnn:
+                attempts.append({'use_gpu': False, 'enable_mkldnn': True})
+            attempts.append({'use_gpu': False})
+            
+            for options in attempts:
+                try:
+                    self._paddle = PaddleOCR(use_angle_cls=False, lang='en', show_log=False, **options)
+                    break
+                except Exception as e:
+                    logging.debug(f"PaddleOCR unavailable with {options}: {e}")
+            else:
+                self._paddle = False
+        return self._paddle or None
+    
+    @staticmethod
+    def _paddle_text(result):
+        """Join the recognized lines of a single-image PaddleOCR result"""
+        lines = result[0] if result else None
+        return ' '.join(line[1][0] for line in lines or [])
+    
+    def _tess_read(self, source):
+        """OCR a binarized array or an image file with the persistent tesserocr handle"""
+        if isinstance(source, str):
+            self._tess.SetImageFile(source)
+        else:
+            height, width = source.shape[:2]
+            self._tess.SetImageBytes(source.tobytes(), width, height, 1, width)
+        return self._tess.GetUTF8Text()
+    
+    def _get_tess(self):
+        """Return the shared tesserocr API, or None when only pytesseract is usable; call under _ocr_lock"""
+        if self._tess is None and PyTessBaseAPI is not None:
+            try:
+                self._tess = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK)
+                self._tess.SetVariable('tessedit_char_whitelist', OCR_WHITELIST)
+            except Exception as e:
+                logging.debug(f"tesserocr unavailable, using pytesseract: {e}")
+                self._tess = False
+        return self._tess or None
+        
+    def submit_many(self, urls, card_data_list):
+        """Queue image analyses without waiting; returns futures in input order"""
+        return [self.executor.submit(self.analyze_property_image, url, card_data)
+                for url, card_data in zip(urls, card_data_list)]
+    
     def analyze_property_image(self, image_url, card_data):
         """Analyze property images to extract additional information"""
-        analysis_results = {
+        if not self.image_analysis:
+            return self._empty_analysis()
+        
+        base_results, status = self._analyze_url(image_url)
+        analysis_results = dict(base_results)
+        
+        # Image type classification depends on the card, so it is applied per call
+        if status != ANALYSIS_FAILED:
+            analysis_results['image_type'] = self._classify_image_type(None, card_data.get('full_card_text', ''))
+        return analysis_results
+    
+    def _empty_analysis(self):
+        """Default analysis result for images that could not be processed"""
+        return {
             'image_quality_score': 0,
             'detected_rooms': [],
             'image_text': '',
             'color_analysis': {},
             'image_type': 'unknown'
         }
+    
+    @staticmethod
+    def _url_key(image_url):
+        """Compact cache key for a URL"""
+        return hashlib.sha1(image_url.encode('utf-8')).digest()[:16]
+    
+    def _analyze_url(self, image_url):
+        """Card-independent analysis of one URL, computed once and cached"""
+        key = self._url_key(image_url)
+        with self._url_cache_lock:
+            future = self._url_cache.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._url_cache[key] = future
+                if len(self._url_cache) > IMAGE_CACHE_SIZE:
+                    self._url_cache.popitem(last=False)
+            else:
+                self._url_cache.move_to_end(key)
+        
+        if not owner:
+            return future.result()
+        
+        result = self._download_and_analyze(image_url)
+        future.set_result(result)
+        
+        # Failures (timeouts, bad status, undecodable bodies) may be transient; waiters
+        # already holding the future share this attempt, later calls retry the URL
+        if result[1] == ANALYSIS_FAILED:
+            with self._url_cache_lock:
+                if self._url_cache.get(key) is future:
+                    del self._url_cache[key]
+        return result
+    
+    def _download_and_analyze(self, image_url):
+        """Download and run the pixel analyses; returns (results, status)"""
+        analysis_results = self._empty_analysis()
         
         try:
-            if not self.image_analysis:
-                return analysis_results
-                
             # Download image
-            response = requests.get(image_url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            content = self._fetch_image_bytes(image_url)
+            if content is None:
+                return analysis_results, ANALYSIS_FAILED
+            
+            # Hashing is microseconds against tens of milliseconds of decoding and analysis
+            content_key = hashlib.sha1(content).digest()
+            with self._url_cache_lock:
+                cached = self._content_cache.get(content_key)
+            if cached is not None:
+                return cached
+            
+            result = self._analyze_content(content, image_url)
+            with self._url_cache_lock:
+                self._content_cache[content_key] = result
+                if len(self._content_cache) > IMAGE_CACHE_SIZE:
+                    self._content_cache.popitem(last=False)
+            return result
             
-            if response.status_code != 200:
-                return analysis_results
-                
-            # Convert to OpenCV format
-            image = Image.open(BytesIO(response.content))
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+        except Exception as e:
+            logging.debug(f"Image analysis failed for {image_url}: {e}")
+            return analysis_results, ANALYSIS_FAILED
+    
+    def _analyze_content(self, content, image_url):
+        """Decode image bytes and run the pixel analyses; returns (results, status)"""
+        analysis_results = self._empty_analysis()
+        
+        try:
+            # Decode straight to an array; without color analysis every pass is grayscale,
+            # so let the decoder produce gray directly
+            decode_flag = cv2.IMREAD_COLOR if self.analyze_colors else cv2.IMREAD_GRAYSCALE
+            cv_image = cv2.imdecode(np.frombuffer(content, dtype=np.uint8), decode_flag)
+            if cv_image is None:
+                return analysis_results, ANALYSIS_FAILED
+            
+            # Thumbnails and tracking pixels carry no usable signal; skip the OpenCV passes
+            height, width = cv_image.shape[:2]
+            if height * width < MIN_ANALYSIS_PIXELS:
+                return analysis_results, ANALYSIS_SKIPPED
+            
+            # Downscale and convert once; every analysis below works on these buffers.
+            # Resizes cascade (full -> OCR size -> analysis size) so full resolution is read once
+            cv_ocr = self._downscale(cv_image, OCR_MAX_DIM) if self.enable_ocr else cv_image
+            cv_small = self._downscale(cv_ocr, 512)
+            gray_small = cv2.cvtColor(cv_small, cv2.COLOR_BGR2GRAY) if cv_small.ndim == 3 else cv_small
             
             # Image quality analysis
-            analysis_results['image_quality_score'] = self._calculate_image_quality(cv_image)
+            analysis_results['image_quality_score'] = self._calculate_image_quality(gray_small)
             
             # Color analysis
-            analysis_results['color_analysis'] = self._analyze_colors(cv_image)
+            if self.analyze_colors:
+                analysis_results['color_analysis'] = self._analyze_colors(cv_small)
             
             # OCR text extraction
             if self.enable_ocr:
-                analysis_results['image_text'] = self._extract_text_from_image(image)
+                ocr_gray = cv2.cvtColor(cv_ocr, cv2.COLOR_BGR2GRAY) if cv_ocr.ndim == 3 else cv_ocr
+                if self.ocr_stage_dir:
+                    analysis_results['ocr_image_path'] = self._stage_ocr_image(ocr_gray)
+                else:
+                    analysis_results['image_text'] = self._extract_text_from_image(ocr_gray)
             
             # Room detection (basic)
-            analysis_results['detected_rooms'] = self._detect_rooms(cv_image)
-            
-            # Image type classification
-            analysis_results['image_type'] = self._classify_image_type(cv_image, card_data.get('full_card_text', ''))
+            analysis_results['detected_rooms'] = self._detect_rooms(gray_small)
             
-            return analysis_results
+            return analysis_results, ANALYSIS_OK
             
         except Exception as e:
             logging.debug(f"Image analysis failed for {image_url}: {e}")
-            return analysis_results
+            return analysis_results, ANALYSIS_FAILED
+    
+    def resolve_staged_ocr(self, text_by_path):
+        """Replace staged OCR paths in cached results with the text they produced"""
+        with self._url_cache_lock:
+            for key, future in self._url_cache.items():
+                if not future.done():
+                    continue
+                results, status = future.result()
+                path = results.get('ocr_image_path')
+                if path in text_by_path:
+                    resolved = {k: v for k, v in results.items() if k != 'ocr_image_path'}
+                    resolved['image_text'] = text_by_path[path]
+                    replacement = Future()
+                    replacement.set_result((resolved, status))
+                    self._url_cache[key] = replacement
+    
+    def _cache_signature(self):
+        """Settings that change what an analysis contains; persisted caches must match them"""
+        return (self.enable_ocr, self.analyze_colors)
+    
+    def load_cache(self, path):
+        """Seed the URL cache from a previous run"""
+        try:
+            with open(path, 'rb') as f:
+                signature, entries = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.debug(f"Ignoring unreadable image cache {path}: {e}")
+            return
+        if signature != self._cache_signature():
+            return
+        
+        # Caches from older runs stored a decoded flag instead of a status; those are re-analyzed
+        with self._url_cache_lock:
+            usable_entries = [(key, result) for key, result in entries.items() if result[1] in (ANALYSIS_OK, ANALYSIS_SKIPPED)]
+            for key, result in usable_entries[-IMAGE_CACHE_SIZE:]:
+                future = Future()
+                future.set_result(result)
+                self._url_cache[key] = future
+        logging.info("Loaded %d cached image analyses from %s", len(usable_entries), path)
     
-    def _calculate_image_quality(self, image):
+    def save_cache(self, path):
+        """Persist finished, non-failed URL analyses; entries still waiting on staged OCR are skipped"""
+        with self._url_cache_lock:
+            entries = {
+                key: future.result() for key, future in self._url_cache.items()
+                if future.done() and future.result()[1] != ANALYSIS_FAILED
+                and 'ocr_image_path' not in future.result()[0]
+            }
+        try:
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump((self._cache_signature(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logging.debug(f"Could not save image cache {path}: {e}")
+    
+    def _fetch_image_bytes(self, image_url):
+        """Download an image body, giving up on anything larger than MAX_IMAGE_BYTES"""
+        with self.session.get(image_url, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                return None
+            
+            # Reject early when the server announces an oversized body
+            declared = response.headers.get('Content-Length')
+            if declared and declared.isdigit() and int(declared) > MAX_IMAGE_BYTES:
+                logging.debug(f"Skipping oversized image {image_url}: {declared} bytes")
+                return None
+            
+            # Read at most one byte past the cap so oversized bodies are detected without buffering them
+            content = response.raw.read(MAX_IMAGE_BYTES + 1, decode_content=True)
+            if len(content) > MAX_IMAGE_BYTES:
+                logging.debug(f"Skipping oversized image {image_url}")
+                return None
+            return content
+    
+    def _downscale(self, image, max_dim):
+        """Shrink an image so its longer side is at most max_dim, keeping aspect ratio"""
+        h, w = image.shape[:2]
+        scale = max_dim / max(h, w)
+        if scale >= 1:
+            return image
+        return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
+    def _calculate_image_quality(self, gray):
         """Calculate image quality score based on sharpness and brightness"""
         try:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Sharpness using Laplacian variance
-            sharpness = cv2.Laplacian(gray, cv2.CV_64F).var()
+            # Sharpness using Laplacian variance; meanStdDev reduces in one native pass
+            _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_32F))
+            sharpness = float(laplacian_std[0, 0]) ** 2
             
             # Brightness
-            brightness = np.mean(gray)
+            brightness = cv2.mean(gray)[0]
             
             # Normalize and combine scores
             sharpness_score = min(sharpness / 1000, 1) * 50  # Max 50 points
@@ -105,88 +607,128 @@ class ImageProcessor:
     def _analyze_colors(self, image):
         """Analyze dominant colors in the image"""
         try:
-            # Resize for faster processing
-            small_image = cv2.resize(image, (150, 150))
+            # Resize for faster processing; 64x64 is plenty for naming colors
+            small_image = cv2.resize(image, (64, 64), interpolation=cv2.INTER_AREA)
             
             # Convert to RGB
             rgb_image = cv2.cvtColor(small_image, cv2.COLOR_BGR2RGB)
             
-            # Reshape for k-means
-            data = rgb_image.reshape((-1, 3))
-            data = np.float32(data)
+            # Quantize to 4 bits per channel and pack into a 12-bit bucket id
+            quantized = (rgb_image >> 4).astype(np.uint16)
+            packed = (quantized[..., 0] << 8) | (quantized[..., 1] << 4) | quantized[..., 2]
+            counts = np.bincount(packed.ravel(), minlength=4096)
+            total = packed.size
             
-            # Apply k-means clustering
-            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
-            k = 3
-            _, labels, centers = cv2.kmeans(data, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
+            # Take the three most populated buckets as the dominant colors
+            top_buckets = np.argpartition(counts, -3)[-3:]
+            top_buckets = top_buckets[np.argsort(counts[top_buckets])[::-1]]
+            top_buckets = top_buckets[counts[top_buckets] > 0]
             
-            # Calculate color percentages
-            unique, counts = np.unique(labels, return_counts=True)
-            color_percentages = {}
+            # Bucket midpoints as the representative RGB values, named in one pass
+            centers = np.stack([(top_buckets >> 8) & 0xF, (top_buckets >> 4) & 0xF, top_buckets & 0xF], axis=1) << 4 | 8
+            color_names = _classify_colors_vec(centers).tolist()
             
-            for i, center in enumerate(centers):
-                if i in unique:
-                    percentage = (counts[np.where(unique == i)[0][0]] / len(data)) * 100
-                    color_name = self._get_color_name(center)
-                    color_percentages[color_name] = round(percentage, 1)
+            color_percentages = {}
+            for bucket, color_name in zip(top_buckets.tolist(), color_names):
+                percentage = (int(counts[bucket]) / total) * 100
+                color_percentages[color_name] = round(color_percentages.get(color_name, 0) + percentage, 1)
             
             return color_percentages
             
         except Exception:
             return {}
     
-    def _get_color_name(self, rgb):
-        """Convert RGB to color name"""
-        r, g, b = rgb
-        
-        if r > 200 and g > 200 and b > 200:
-            return 'white'
-        elif r < 50 and g < 50 and b < 50:
-            return 'black'
-        elif r > g and r > b:
-            return 'red'
-        elif g > r and g > b:
-            return 'green'
-        elif b > r and b > g:
-            return 'blue'
-        elif r > 150 and g > 150:
-            return 'yellow'
-        elif r > 100 and g < 100 and b < 100:
-            return 'brown'
-        else:
-            return 'mixed'
-    
     def _extract_text_from_image(self, image):
         """Extract text from image using OCR"""
         try:
-            # Configure tesseract for better accuracy
-            config = '--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ₹.,/-'
-            text = pytesseract.image_to_string(image, config=config)
+            image = self._prepare_ocr_image(image)
             
-            # Clean and filter text
-            cleaned_text = ' '.join(text.split())
+            # Reuse a loaded model when tesserocr or PaddleOCR is installed
+            with self._ocr_lock:
+                engine = self._get_ocr_engine()
+                if engine is not None:
+                    text = engine(image)
             
-            # Extract meaningful information
-            price_match = re.search(r'₹\s*[\d,\.]+\s*(cr|crore|lakh|l)', cleaned_text, re.IGNORECASE)
-            area_match = re.search(r'\d+\s*(?:sq\.?ft|sqft)', cleaned_text, re.IGNORECASE)
-            
-            extracted_info = []
-            if price_match:
-                extracted_info.append(f"Price: {price_match.group()}")
-            if area_match:
-                extracted_info.append(f"Area: {area_match.group()}")
-            
-            return '; '.join(extracted_info) if extracted_info else cleaned_text[:200]
+            if engine is None:
+                with TESSERACT_SLOTS:
+                    text = pytesseract.image_to_string(image, config=OCR_CONFIG, timeout=OCR_TIMEOUT)
+            return self._summarize_ocr_text(text)
             
         except Exception as e:
             logging.debug(f"OCR extraction failed: {e}")
             return ''
     
-    def _detect_rooms(self, image):
+    def _prepare_ocr_image(self, gray):
+        """Downscale and binarize a grayscale image so Tesseract can skip its own thresholding"""
+        # Tesseract cost grows with area while accuracy plateaus around 1500px
+        gray = self._downscale(gray, OCR_MAX_DIM)
+        return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+    
+    def _stage_ocr_image(self, gray):
+        """Write an OCR-ready image to the stage dir and return its path"""
+        try:
+            os.makedirs(self.ocr_stage_dir, exist_ok=True)
+            path = os.path.join(self.ocr_stage_dir, f"img_{next(self._ocr_counter)}.png")
+            if cv2.imwrite(path, self._prepare_ocr_image(gray)):
+                return path
+        except Exception as e:
+            logging.debug(f"OCR staging failed: {e}")
+        return None
+    
+    def extract_text_batch(self, paths):
+        """OCR staged images with a single Tesseract process; results follow input order"""
+        if not paths:
+            return []
+        
+        # With a persistent model there is no process spawn to amortize; read each image in turn
+        with self._ocr_lock:
+            engine = self._get_ocr_engine()
+            if engine is not None:
+                texts = []
+                for path in paths:
+                    try:
+                        texts.append(self._summarize_ocr_text(engine(path)))
+                    except Exception as e:
+                        logging.debug(f"OCR failed for {path}: {e}")
+                        texts.append('')
+                return texts
+        
+        # Tesseract treats a .txt input as a list of images and emits one page per image
+        list_path = os.path.join(self.ocr_stage_dir, 'images.txt')
+        try:
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(paths) + '\n')
+            text = pytesseract.image_to_string(list_path, config=OCR_CONFIG, timeout=OCR_TIMEOUT * len(paths))
+        except Exception as e:
+            logging.debug(f"Batched OCR failed: {e}")
+            return [''] * len(paths)
+        
+        pages = text.split('\x0c')
+        if len(pages) < len(paths):
+            logging.warning("Batched OCR returned %d pages for %d images", len(pages), len(paths))
+            pages += [''] * (len(paths) - len(pages))
+        return [self._summarize_ocr_text(page) for page in pages[:len(paths)]]
+    
+    def _summarize_ocr_text(self, text):
+        """Reduce raw OCR output to price/area hints or a short snippet"""
+        # Clean and filter text
+        cleaned_text = ' '.join(text.split())
+        
+        # Extract meaningful information
+        price_match = re.search(r'₹\s*[\d,\.]+\s*(cr|crore|lakh|l)', cleaned_text, re.IGNORECASE)
+        area_match = re.search(r'\d+\s*(?:sq\.?ft|sqft)', cleaned_text, re.IGNORECASE)
+        
+        extracted_info = []
+        if price_match:
+            extracted_info.append(f"Price: {price_match.group()}")
+        if area_match:
+            extracted_info.append(f"Area: {area_match.group()}")
+        
+        return '; '.join(extracted_info) if extracted_info else cleaned_text[:200]
+    
+    def _detect_rooms(self, gray):
         """Basic room detection using simple image analysis"""
         try:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
             # Simple room indicators
             rooms = []
             
@@ -194,10 +736,15 @@ class ImageProcessor:
             edges = cv2.Canny(gray, 50, 150)
             contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
+            # A contour that fills most of its bounding box is treated as rectangular;
+            # far cheaper than simplifying every contour with approxPolyDP
             rectangular_shapes = 0
             for contour in contours:
-                approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
-                if len(approx) == 4:
+                area = cv2.contourArea(contour)
+                if area <= 50:
+                    continue
+                _, _, w, h = cv2.boundingRect(contour)
+                if area / (w * h) > 0.7:
                     rectangular_shapes += 1
             
             if rectangular_shapes > 5:
@@ -255,26 +802,54 @@ class MagicBricksScraper:
         self.incremental_save = config.getboolean("output", "incremental_save", fallback=True)
         self.save_batch_size = int(config.get("output", "save_batch_size", fallback="10"))
         
-        # Initialize output file paths
+        # Initialize output file paths; parquet skips the Excel pipeline entirely
+        self.output_format = config.get("output", "output_format", fallback="xlsx").lower()
+        extension = "parquet" if self.output_format == "parquet" else "xlsx"
         timestamp = self.start_ts.strftime('%Y%m%d_%H%M%S')
-        self.temp_output_path = os.path.join(self.output_dir, f"magicbricks_temp_{self.run_id}_{timestamp}.xlsx")
-        self.final_output_path = os.path.join(self.output_dir, f"magicbricks_enhanced_{self.run_id}_{timestamp}.xlsx")
+        self.final_output_path = os.path.join(self.output_dir, f"magicbricks_enhanced_{self.run_id}_{timestamp}.{extension}")
         self.backup_csv_path = os.path.join(self.output_dir, f"magicbricks_backup_{self.run_id}_{timestamp}.csv")
         
-        # Data storage for incremental saves
+        # Data storage for incremental saves; rows before _last_saved_idx are already in the CSV
         self.extracted_data = []
+        self._last_saved_idx = 0
+        self._backup_file = None
+        self._backup_writer = None
+        # Header of the backup on disk, kept after closing so later saves append under it
+        self._backup_columns = None
         
         # Delays
         self.min_delay = float(config.get("http", "min_delay", fallback="1.2"))
         self.max_delay = float(config.get("http", "max_delay", fallback="3.5"))
+        
+        # Cards are paced by a token bucket; time spent extracting already counts toward the gap
+        self.card_bucket = TokenBucket(
+            rate=config.getfloat("http", "card_rate", fallback=2.0),
+            capacity=config.getint("http", "card_burst", fallback=4),
+        )
 
         # Enhanced interaction settings
         self.deep_extraction = config.getboolean("extraction_settings", "deep_extraction", fallback=True)
         self.click_dropdowns = config.getboolean("extraction_settings", "click_dropdowns", fallback=True)
         self.extract_hidden_info = config.getboolean("extraction_settings", "extract_hidden_info", fallback=True)
 
-        # Initialize image processor
-        self.image_processor = ImageProcessor(config)
+        # Initialize image processor; OCR is staged per card and run once at finalization
+        self.ocr_stage_dir = None
+        if (config.getboolean("image_processing", "enable_ocr", fallback=False)
+                and config.getboolean("image_processing", "batch_ocr", fallback=True)):
+            self.ocr_stage_dir = os.path.join(self.output_dir, "ocr_stage", str(self.run_id))
+        self.image_processor = ImageProcessor(config, ocr_stage_dir=self.ocr_stage_dir)
+        self.ocr_queue = []
+        
+        # Image analyses survive between runs so repeated stock photos are never re-fetched
+        self.image_cache_path = None
+        if config.getboolean("image_processing", "persist_cache", fallback=True):
+            self.image_cache_path = os.path.join(self.output_dir, "ocr_cache.pkl")
+            self.image_processor.load_cache(self.image_cache_path)
+        
+        # Image analyses run in the background while Selenium moves on to the next card;
+        # past max_pending_cards the oldest are waited on so the backlog stays bounded
+        self.pending_analyses = []
+        self.max_pending_cards = config.getint("image_processing", "max_pending_cards", fallback=32)
 
         # Enhanced extraction patterns
         self.extraction_patterns = {
@@ -306,6 +881,15 @@ class MagicBricksScraper:
                 r'(\d+)\s*out\s*of\s*(\d+)',
             ]
         }
+        
+        # Compile once; every card runs every pattern. Patterns stay separate on purpose:
+        # re optimizes each standalone pattern's prefix, and a fused per-field alternation
+        # (even without priority handling) searched card text slower than these individual
+        # searches, and it changed which pattern wins.
+        self.extraction_patterns = {
+            field_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for field_type, patterns in self.extraction_patterns.items()
+        }
 
         self.stats = {
             "total_processed": 0,
@@ -319,55 +903,79 @@ class MagicBricksScraper:
         }
 
     def _save_data_incremental(self, force_save=False):
-        """Save data incrementally to prevent data loss"""
+        """Append newly extracted rows to the CSV backup to prevent data loss"""
         if not self.incremental_save:
             return
         
-        # Check if we should save (batch reached or forced)
-        if not force_save and len(self.extracted_data) < self.save_batch_size:
-            return
+        if force_save:
+            self._collect_image_analyses(wait=True)
         
-        if not self.extracted_data:
+        # Only rows whose image analyses have been merged are final enough to persist
+        pending = {id(card_data) for card_data, _, _ in self.pending_analyses}
+        end = self._last_saved_idx
+        while end < len(self.extracted_data) and id(self.extracted_data[end]) not in pending:
+            end += 1
+        
+        # Check if we should save (batch reached or forced)
+        unsaved = end - self._last_saved_idx
+        if not unsaved or (not force_save and unsaved < self.save_batch_size):
             return
         
         try:
-            df = pd.DataFrame(self.extracted_data)
-            
-            # Save as CSV backup (faster and more reliable for incremental saves)
-            df.to_csv(self.backup_csv_path, index=False)
-            
-            # Save as Excel with error handling
-            try:
-                with pd.ExcelWriter(self.temp_output_path, engine='openpyxl') as writer:
-                    df.to_excel(writer, sheet_name='Listings', index=False)
-                    
-                    # Add progress sheet
-                    progress_data = {
-                        'Metric': [
-                            'Total Extracted', 'Cards with Images', 'Cards without Images', 
-                            'Dropdowns Opened', 'Images Analyzed', 'Last Updated'
-                        ],
-                        'Value': [
-                            len(self.extracted_data),
-                            self.stats['cards_with_images'], 
-                            self.stats['cards_without_images'],
-                            self.stats['dropdowns_opened'],
-                            self.stats.get('images_analyzed', 0),
-                            datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        ]
-                    }
-                    progress_df = pd.DataFrame(progress_data)
-                    progress_df.to_excel(writer, sheet_name='Progress', index=False)
-                
-                logging.info("Incremental save completed: %d records saved to %s", 
-                           len(self.extracted_data), self.temp_output_path)
-                
-            except Exception as excel_error:
-                logging.warning("Excel save failed, CSV backup available: %s", excel_error)
+            batch = self.extracted_data[self._last_saved_idx:end]
+            
+            # The backup stays open for the run; keys outside its header widen it
+            batch_keys = dict.fromkeys(key for row in batch for key in row)
+            if self._backup_writer is None:
+                self._open_backup(self._backup_columns or list(dict.fromkeys(itertools.chain(BACKUP_COLUMNS, batch_keys))))
+            new_keys = [key for key in batch_keys if key not in self._backup_writer.fieldnames]
+            if new_keys:
+                self._widen_backup(new_keys)
+            
+            self._backup_writer.writerows(batch)
+            self._backup_file.flush()
+            self._last_saved_idx = end
+            
+            logging.info("Incremental save completed: %d records saved to %s "
+                       "(%d with images, %d without, %d dropdowns opened, %d images analyzed)",
+                       end, self.backup_csv_path,
+                       self.stats['cards_with_images'], self.stats['cards_without_images'],
+                       self.stats['dropdowns_opened'], self.stats.get('images_analyzed', 0))
                 
         except Exception as e:
             logging.error("Incremental save failed: %s", e)
 
+    def _open_backup(self, columns):
+        """Open the CSV backup for appending, writing the header only when the file is new"""
+        is_new = not os.path.exists(self.backup_csv_path)
+        self._backup_file = open(self.backup_csv_path, 'a', newline='', encoding='utf-8')
+        self._backup_writer = csv.DictWriter(self._backup_file, fieldnames=columns)
+        if is_new:
+            self._backup_writer.writeheader()
+        self._backup_columns = columns
+
+    def _widen_backup(self, new_keys):
+        """Rewrite the CSV backup with extra columns, since a CSV header cannot grow in place"""
+        columns = self._backup_writer.fieldnames + new_keys
+        self._close_backup()
+        # Write the wider copy beside the backup and swap it in, so a crash mid-rewrite loses nothing
+        temp_path = self.backup_csv_path + '.tmp'
+        with open(self.backup_csv_path, newline='', encoding='utf-8') as src, \
+                open(temp_path, 'w', newline='', encoding='utf-8') as dst:
+            writer = csv.DictWriter(dst, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(csv.DictReader(src))
+        os.replace(temp_path, self.backup_csv_path)
+        self._open_backup(columns)
+        logging.info("CSV backup widened with %d new columns: %s", len(new_keys), ', '.join(new_keys))
+
+    def _close_backup(self):
+        """Close the CSV backup opened by incremental saves"""
+        if self._backup_file is not None:
+            self._backup_file.close()
+            self._backup_file = None
+            self._backup_writer = None
+
     def _setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
         import signal
@@ -387,35 +995,55 @@ class MagicBricksScraper:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+    def _apply_batched_ocr(self):
+        """Run the staged OCR images through Tesseract once and merge text back into rows"""
+        if not self.ocr_queue:
+            return
+        
+        # Cached analyses share a staged image, so OCR each path only once
+        rows, image_numbers, paths = zip(*self.ocr_queue)
+        unique_paths = list(dict.fromkeys(paths))
+        text_by_path = dict(zip(unique_paths, self.image_processor.extract_text_batch(unique_paths)))
+        for row, image_number, path in zip(rows, image_numbers, paths):
+            text = text_by_path.get(path)
+            if text:
+                row['extracted_image_text'] = (row.get('extracted_image_text') or '') + f"Image {image_number}: {text}; "
+        
+        self.image_processor.resolve_staged_ocr(text_by_path)
+        logging.info("Batched OCR completed for %d images", len(unique_paths))
+        self.ocr_queue = []
+        shutil.rmtree(self.ocr_stage_dir, ignore_errors=True)
+
     def _finalize_output(self):
         """Finalize output files with proper formatting"""
+        self._collect_image_analyses(wait=True)
+        # Flush the last partial batch before the backup closes
+        self._save_data_incremental(force_save=True)
+        self._close_backup()
+        self._apply_batched_ocr()
+        if self.image_cache_path:
+            self.image_processor.save_cache(self.image_cache_path)
+        
         if not self.extracted_data:
             logging.warning("No data to finalize")
             return None
         
         try:
-            df = pd.DataFrame(self.extracted_data)
-            
-            # Define column order for better organization
-            preferred_columns = [
-                'card_number', 'extraction_timestamp', 'title', 'price', 'locality', 'society_name',
-                'configuration', 'property_type', 'transaction_type', 'status', 
-                'super_area', 'carpet_area', 'built_up_area', 'plot_area',
-                'images_count', 'has_images', 'primary_image_url',
-                'property_detail_url', 'society_url', 'total_links_count',
-                'furnishing', 'bathrooms', 'parking', 'balconies', 'floor_info',
-                'posted_date', 'owner_type', 'amenities', 'features',
-                'extraction_completeness', 'full_card_text'
-            ]
-            
-            # Reorder columns
-            available_columns = [col for col in preferred_columns if col in df.columns]
-            remaining_columns = [col for col in df.columns if col not in preferred_columns]
+            # Reorder columns; keys are gathered in first-seen order across all rows
+            all_columns = list(dict.fromkeys(key for row in self.extracted_data for key in row))
+            available_columns = [col for col in PREFERRED_COLUMNS if col in all_columns]
+            remaining_columns = [col for col in all_columns if col not in PREFERRED_COLUMNS]
             final_columns = available_columns + remaining_columns
-            df = df[final_columns]
+            
+            if self.output_format == "parquet":
+                self._write_parquet(final_columns)
+                logging.info("Final output saved: %s", self.final_output_path)
+                return self.final_output_path
+            
+            df = pd.DataFrame(self.extracted_data, columns=final_columns)
             
             # Save final Excel file
-            with pd.ExcelWriter(self.final_output_path, engine='openpyxl') as writer:
+            with pd.ExcelWriter(self.final_output_path, engine='xlsxwriter') as writer:
                 df.to_excel(writer, sheet_name='Listings', index=False)
                 
                 # Add comprehensive summary sheet
@@ -445,13 +1073,6 @@ class MagicBricksScraper:
                     log_df = pd.DataFrame(self.extraction_log)
                     log_df.to_excel(writer, sheet_name='Extraction_Log', index=False)
             
-            # Clean up temp file
-            if os.path.exists(self.temp_output_path):
-                try:
-                    os.remove(self.temp_output_path)
-                except:
-                    pass
-            
             logging.info("Final output saved: %s", self.final_output_path)
             return self.final_output_path
             
@@ -463,6 +1084,17 @@ class MagicBricksScraper:
                 return self.backup_csv_path
             return None
 
+    def _write_parquet(self, columns):
+        """Write listings as zstd-compressed Parquet, building Arrow columns straight from the rows"""
+        arrays = {}
+        for column in columns:
+            values = [row.get(column) for row in self.extracted_data]
+            # Per-card lists and dicts vary in shape, so store them as JSON text
+            if any(isinstance(v, (list, dict)) for v in values):
+                values = [_json_dumps(v) if isinstance(v, (list, dict)) else v for v in values]
+            arrays[column] = pa.array(values)
+        pq.write_table(pa.table(arrays), self.final_output_path, compression='zstd')
+
     def _setup_webdriver(self):
         """Setup Chrome WebDriver with enhanced automation capabilities"""
         opts = webdriver.ChromeOptions()
@@ -501,10 +1133,11 @@ class MagicBricksScraper:
         if not text or field_type not in self.extraction_patterns:
             return None
             
-        text = str(text).lower().strip()
+        # Patterns are case-insensitive, so no lowercased copy of the text is needed
+        text = str(text).strip()
         
         for pattern in self.extraction_patterns[field_type]:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 if field_type == 'floor' and len(match.groups()) > 1:
                     return f"{match.group(1)} of {match.group(2)}"
@@ -538,40 +1171,38 @@ class MagicBricksScraper:
         expanded_count = 0
         hidden_info = {}
         
-        for selector in expandable_selectors:
+        # One script finds every clickable candidate instead of a find/is_displayed/is_enabled trip each
+        try:
+            candidates = self.driver.execute_script(EXPANDABLE_PROBE_JS, card, expandable_selectors) or []
+        except Exception as e:
+            logging.debug(f"Error finding expandable elements: {e}")
+            candidates = []
+        
+        for selector, element in candidates:
             try:
-                elements = card.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    try:
-                        # Check if element is clickable and visible
-                        if element.is_displayed() and element.is_enabled():
-                            # Store pre-click state
-                            pre_text = card.text
-                            
-                            # Scroll element into view
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                            self._smart_sleep(0.5, 1.0)
-                            
-                            # Try clicking
-                            element.click()
-                            expanded_count += 1
-                            self._smart_sleep(1.0, 2.0)
-                            
-                            # Check for new content
-                            post_text = card.text
-                            if len(post_text) > len(pre_text):
-                                new_content = post_text[len(pre_text):].strip()
-                                if new_content:
-                                    hidden_info[f'expanded_content_{expanded_count}'] = new_content
-                            
-                            logging.debug(f"Expanded element: {selector}")
-                            
-                    except (ElementNotInteractableException, Exception) as e:
-                        logging.debug(f"Could not interact with {selector}: {e}")
-                        continue
-                        
-            except Exception as e:
-                logging.debug(f"Error finding expandable elements with {selector}: {e}")
+                # Store pre-click state
+                pre_text = card.text
+                
+                # Scroll element into view
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                self._smart_sleep(0.5, 1.0)
+                
+                # Try clicking
+                element.click()
+                expanded_count += 1
+                self._smart_sleep(1.0, 2.0)
+                
+                # Check for new content
+                post_text = card.text
+                if len(post_text) > len(pre_text):
+                    new_content = post_text[len(pre_text):].strip()
+                    if new_content:
+                        hidden_info[f'expanded_content_{expanded_count}'] = new_content
+                
+                logging.debug(f"Expanded element: {selector}")
+                
+            except (ElementNotInteractableException, Exception) as e:
+                logging.debug(f"Could not interact with {selector}: {e}")
                 continue
         
         if expanded_count > 0:
@@ -595,8 +1226,10 @@ class MagicBricksScraper:
             expanded, hidden_info = self._click_and_expand_all_elements(card)
             data.update(hidden_info)
             
-            # Step 2: Get comprehensive text after expansion
-            full_text = card.text.strip()
+            # Step 2: Read the expanded card once; text, selector fields, images,
+            # amenities and links all come back from a single script call
+            snapshot = self._snapshot_card(card)
+            full_text = (snapshot['text'] if 'text' in snapshot else card.text).strip()
             data['full_card_text'] = full_text
             
             # Step 3: Extract structured data using patterns
@@ -605,40 +1238,13 @@ class MagicBricksScraper:
                 if extracted:
                     data[field_type] = extracted
             
-            # Step 4: Extract specific fields with enhanced selectors
-            field_extractions = {
-                'title': ['.mb-srp__card__title', '.cardTitle', 'h2', 'h3', '.title', '[data-testid*="title"]'],
-                'price': ['.mb-srp__card__price', '.price', '.priceValue', '[data-testid*="price"]'],
-                'locality': ['.mb-srp__card__summary__locality', '.locality', '.location', '[data-testid*="locality"]'],
-                'society_name': ['.societyName', '.projectName', '.buildingName', 'a[href*="project"]'],
-                'configuration': ['.mb-srp__card__summary__config', '.configuration', '.bhk', '[data-testid*="config"]'],
-                'property_type': ['.propertyType', '.apartmentType', '[data-testid*="type"]'],
-                'transaction_type': ['.mb-srp__card__badge', '.transaction', '[data-testid*="transaction"]'],
-                'status': ['.status', '.availability', '[data-testid*="status"]'],
-                'furnishing': ['.furnishing', '.furnished', '[data-testid*="furnish"]'],
-                'posted_date': ['.postedOn', '.postedDate', '[data-testid*="date"]'],
-                'owner_type': ['.ownerType', '.postedBy', '[data-testid*="owner"]'],
-                'contact_info': ['.contact', '.phone', '.mobile', '[data-testid*="contact"]'],
-                'facing': ['.facing', '[data-testid*="facing"]'],
-                'age_of_property': ['.age', '.construction', '[data-testid*="age"]'],
-                'balconies': ['.balcony', '[data-testid*="balcon"]'],
-                'floor_details': ['.floor', '.floorInfo', '[data-testid*="floor"]']
-            }
-            
-            for field, selectors in field_extractions.items():
-                if field not in data or not data.get(field):
-                    for selector in selectors:
-                        try:
-                            element = card.find_element(By.CSS_SELECTOR, selector)
-                            text = element.text.strip()
-                            if text:
-                                data[field] = text
-                                break
-                        except NoSuchElementException:
-                            continue
+            # Step 4: Fill fields the patterns missed from the enhanced selectors
+            for field, text in snapshot.get('fields', {}).items():
+                if not data.get(field):
+                    data[field] = text
             
             # Step 5: Enhanced image extraction with processing
-            images = self._extract_and_analyze_images(card, data)
+            images = self._extract_and_analyze_images(snapshot, data)
             data.update({
                 'images_count': images['count'],
                 'has_images': images['count'] > 0,
@@ -651,22 +1257,20 @@ class MagicBricksScraper:
             })
             
             # Step 6: Extract amenities and features
-            amenities = self._extract_amenities_features(card)
+            amenities = self._extract_amenities_features(snapshot)
             data.update(amenities)
             
             # Step 7: Extract all links
-            links = self._extract_all_links(card)
+            links = self._extract_all_links(snapshot)
             data.update(links)
             
             # Step 8: Calculate completeness
-            non_empty_fields = sum(1 for v in data.values() if v not in [None, '', 0, []])
-            total_expected_fields = 40
-            data['extraction_completeness'] = round((non_empty_fields / total_expected_fields) * 100, 1)
+            data['extraction_completeness'] = self._calculate_completeness(data)
             
             self.stats['successful_extractions'] += 1
             
             logging.info(f"  Card {card_index}: {data['extraction_completeness']}% complete, "
-                        f"{images['count']} images analyzed")
+                        f"{images['count']} images found")
             
             return data
             
@@ -675,7 +1279,23 @@ class MagicBricksScraper:
             data['extraction_error'] = str(e)
             return data
 
-    def _extract_and_analyze_images(self, card, card_data):
+    def _calculate_completeness(self, data):
+        """Percentage of the expected fields that carry a value"""
+        non_empty_fields = sum(1 for k, v in data.items() if k != 'extraction_completeness' and v not in [None, '', 0, []])
+        total_expected_fields = 40
+        return round((non_empty_fields / total_expected_fields) * 100, 1)
+
+    def _snapshot_card(self, card):
+        """Fetch text, selector fields, image, amenity and link data for a card in a single round trip"""
+        try:
+            return self.driver.execute_script(
+                CARD_JS, card, IMAGE_URL_ATTRIBUTES, AMENITY_SELECTORS, FIELD_SELECTORS
+            ) or {}
+        except Exception as e:
+            logging.warning(f"Card snapshot failed: {e}")
+            return {}
+
+    def _extract_and_analyze_images(self, snapshot, card_data):
         """Enhanced image extraction with analysis"""
         images = {
             'urls': [],
@@ -689,72 +1309,27 @@ class MagicBricksScraper:
         
         try:
             # Get all image URLs
-            img_elements = card.find_elements(By.TAG_NAME, "img")
-            
-            for img in img_elements:
-                for attr in ['src', 'data-src', 'data-original', 'data-lazy', 'data-srcset']:
-                    url = img.get_attribute(attr)
-                    if url and url not in images['urls'] and not url.startswith('data:'):
-                        # Clean URL
-                        if url.startswith('/'):
-                            url = 'https://www.magicbricks.com' + url
-                        images['urls'].append(url)
+            for img_attributes in snapshot.get('imgs', []):
+                for url in img_attributes:
+                    if url and not url.startswith('data:'):
+                        url = _absolutize(url)
+                        if url not in images['urls']:
+                            images['urls'].append(url)
             
             # Background images
-            try:
-                bg_images = self.driver.execute_script("""
-                    var card = arguments[0];
-                    var images = [];
-                    var elements = card.querySelectorAll('*');
-                    
-                    elements.forEach(function(el) {
-                        var style = window.getComputedStyle(el);
-                        var bgImage = style.backgroundImage;
-                        if (bgImage && bgImage !== 'none' && bgImage.includes('url(')) {
-                            var url = bgImage.match(/url\\(["']?([^"'\\)]+)["']?\\)/);
-                            if (url && url[1] && !url[1].startsWith('data:')) {
-                                images.push(url[1]);
-                            }
-                        }
-                    });
-                    
-                    return [...new Set(images)];
-                """, card)
-                
-                for url in bg_images:
-                    if url not in images['urls']:
-                        if url.startswith('/'):
-                            url = 'https://www.magicbricks.com' + url
-                        images['urls'].append(url)
-                        
-            except Exception:
-                pass
+            for url in snapshot.get('bgs', []):
+                url = _absolutize(url)
+                if url not in images['urls']:
+                    images['urls'].append(url)
             
             images['count'] = len(images['urls'])
             images['primary_image'] = images['urls'][0] if images['urls'] else None
             
-            # Process images with AI
+            # Process images with AI; results are merged into the row once they finish
             if images['urls'] and self.image_processor.image_analysis:
-                for i, url in enumerate(images['urls'][:3]):  # Analyze first 3 images
-                    try:
-                        analysis = self.image_processor.analyze_property_image(url, card_data)
-                        
-                        if analysis['image_quality_score'] > 0:
-                            images['quality_scores'].append(analysis['image_quality_score'])
-                        
-                        if analysis['image_text']:
-                            images['ocr_text'] += f"Image {i+1}: {analysis['image_text']}; "
-                        
-                        if analysis['color_analysis']:
-                            images['colors'].update(analysis['color_analysis'])
-                        
-                        if analysis['image_type'] != 'unknown':
-                            images['types'].append(analysis['image_type'])
-                        
-                        self.stats['images_analyzed'] += 1
-                        
-                    except Exception as e:
-                        logging.debug(f"Failed to analyze image {url}: {e}")
+                analyzed_urls = images['urls'][:3]  # Analyze first 3 images
+                futures = self.image_processor.submit_many(analyzed_urls, [card_data] * len(analyzed_urls))
+                self.pending_analyses.append((card_data, analyzed_urls, futures))
             
             if images['count'] > 0:
                 self.stats['cards_with_images'] += 1
@@ -767,7 +1342,44 @@ class MagicBricksScraper:
             logging.warning(f"Image extraction failed: {e}")
             return images
 
-    def _extract_amenities_features(self, card):
+    def _merge_image_analyses(self, card_data, urls, analyses):
+        """Fold finished image analyses into a card row"""
+        for i, (url, analysis) in enumerate(zip(urls, analyses)):
+            try:
+                if analysis['image_quality_score'] > 0:
+                    card_data.setdefault('image_quality_scores', []).append(analysis['image_quality_score'])
+                
+                if analysis['image_text']:
+                    card_data['extracted_image_text'] = (card_data.get('extracted_image_text') or '') + f"Image {i+1}: {analysis['image_text']}; "
+                
+                if analysis.get('ocr_image_path'):
+                    self.ocr_queue.append((card_data, i + 1, analysis['ocr_image_path']))
+                
+                if analysis['color_analysis']:
+                    card_data.setdefault('dominant_colors', {}).update(analysis['color_analysis'])
+                
+                if analysis['image_type'] != 'unknown':
+                    card_data.setdefault('image_types', []).append(analysis['image_type'])
+                
+                self.stats['images_analyzed'] += 1
+                
+            except Exception as e:
+                logging.debug(f"Failed to analyze image {url}: {e}")
+        
+        card_data['extraction_completeness'] = self._calculate_completeness(card_data)
+
+    def _collect_image_analyses(self, wait=False):
+        """Merge background image analyses that are done, or all of them when wait is set"""
+        still_pending = []
+        overflow = len(self.pending_analyses) - self.max_pending_cards
+        for position, (card_data, urls, futures) in enumerate(self.pending_analyses):
+            if wait or position < overflow or all(future.done() for future in futures):
+                self._merge_image_analyses(card_data, urls, [future.result() for future in futures])
+            else:
+                still_pending.append((card_data, urls, futures))
+        self.pending_analyses = still_pending
+
+    def _extract_amenities_features(self, snapshot):
         """Extract amenities and features"""
         amenities_data = {
             'amenities': [],
@@ -777,36 +1389,19 @@ class MagicBricksScraper:
         }
         
         try:
-            # Look for amenity sections
-            amenity_selectors = [
-                '.amenities', '.facilities', '.features', '.highlights',
-                '[class*="amenity"]', '[class*="feature"]', '[class*="facility"]',
-                '.nearby', '.location-advantages'
-            ]
-            
-            for selector in amenity_selectors:
-                try:
-                    elements = card.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) < 200:
-                            # Categorize based on content
-                            text_lower = text.lower()
-                            if any(word in text_lower for word in ['gym', 'pool', 'park', 'security']):
-                                amenities_data['amenities'].append(text)
-                            elif any(word in text_lower for word in ['metro', 'school', 'hospital', 'mall']):
-                                amenities_data['nearby_facilities'].append(text)
-                            elif any(word in text_lower for word in ['premium', 'luxury', 'spacious']):
-                                amenities_data['highlights'].append(text)
-                            else:
-                                amenities_data['features'].append(text)
-                except Exception:
-                    continue
+            # Texts of the amenity sections, in AMENITY_SELECTORS order
+            for text in snapshot.get('amenities', []):
+                if text and len(text) < 200:
+                    # Categorize based on content
+                    category = next(
+                        (key for key, pattern in AMENITY_CATEGORIES if pattern.search(text)), 'features'
+                    )
+                    amenities_data[category].append(text)
             
             # Convert lists to strings
             for key in amenities_data:
                 if amenities_data[key]:
-                    amenities_data[key] = '; '.join(list(set(amenities_data[key])))
+                    amenities_data[key] = '; '.join(dict.fromkeys(amenities_data[key]))
                 else:
                     amenities_data[key] = None
             
@@ -816,7 +1411,7 @@ class MagicBricksScraper:
             logging.warning(f"Amenities extraction failed: {e}")
             return {k: None for k in amenities_data.keys()}
 
-    def _extract_all_links(self, card):
+    def _extract_all_links(self, snapshot):
         """Extract all links from card"""
         links_data = {
             'property_detail_url': None,
@@ -828,36 +1423,25 @@ class MagicBricksScraper:
         }
         
         try:
-            anchors = card.find_elements(By.TAG_NAME, "a")
-            
-            for anchor in anchors:
-                href = anchor.get_attribute("href")
+            for href in snapshot.get('links', []):
                 if not href or href.startswith("javascript:"):
                     continue
                 
-                if href.startswith("/"):
-                    href = "https://www.magicbricks.com" + href
-                
-                text_content = anchor.text.strip().lower()
+                href = _absolutize(href)
                 
-                # Categorize links
-                if "propertydetail" in href.lower() or "property-for-" in href.lower():
-                    links_data['property_detail_url'] = href
-                elif "project" in href.lower() or "society" in href.lower():
-                    links_data['society_url'] = href
-                elif "builder" in href.lower():
-                    links_data['builder_url'] = href
-                elif any(word in href.lower() for word in ["contact", "phone", "call"]):
-                    links_data['contact_links'].append(href)
-                elif any(word in href.lower() for word in ["facebook", "twitter", "instagram"]):
-                    links_data['social_links'].append(href)
+                # Categorize links; single-valued categories keep the last match
+                category = next((key for key, pattern in LINK_CATEGORIES if pattern.search(href)), None)
+                if category in ('contact_links', 'social_links'):
+                    links_data[category].append(href)
+                elif category:
+                    links_data[category] = href
                 
                 links_data['all_links'].append(href)
             
             # Convert lists to strings
             for key in ['all_links', 'contact_links', 'social_links']:
                 if links_data[key]:
-                    links_data[key] = "; ".join(list(set(links_data[key])))
+                    links_data[key] = "; ".join(dict.fromkeys(links_data[key]))
                 else:
                     links_data[key] = None
 
@@ -878,19 +1462,20 @@ class MagicBricksScraper:
             self.driver.get(self.search_url)
 
             self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.mb-srp__card, div.listingCard, .srpCard"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, CARD_SELECTOR))
             )
             logging.info("Search page loaded, starting extraction...")
 
             while len(listings) < self.max_listings and scrolls < self.max_scrolls:
-                card_els = self.driver.find_elements(By.CSS_SELECTOR, "div.mb-srp__card, div.listingCard, .srpCard")
+                card_count, card_els = self.driver.execute_script(NEW_CARDS_JS, CARD_SELECTOR, last_count)
 
-                for idx, card in enumerate(card_els[last_count:], start=last_count + 1):
-                    self._smart_sleep(0.5, 1.2)
+                for idx, card in enumerate(card_els, start=last_count + 1):
+                    self.card_bucket.acquire()
                     try:
                         row = self._extract_comprehensive_data_with_images(card, idx)
                         listings.append(row)
                         self.extracted_data.append(row)
+                        self._collect_image_analyses()
 
                         # Incremental save
                         self._save_data_incremental()
@@ -902,12 +1487,13 @@ class MagicBricksScraper:
                     if len(listings) >= self.max_listings:
                         break
 
-                last_count = len(card_els)
+                last_count = card_count
                 scrolls += 1
 
                 self.driver.execute_script("window.scrollBy(0, 1500);")
                 self._smart_sleep(1.0, 2.0)
 
+            self._collect_image_analyses(wait=True)
             logging.info(f"Scraping complete: {len(listings)} cards extracted")
             return listings
 
@@ -931,6 +1517,7 @@ class MagicBricksScraper:
                 self.driver.quit()
             except:
                 pass
+            self.image_processor.close()
 
 
 def create_default_config():
@@ -952,17 +1539,28 @@ def create_default_config():
         "enable_ocr": "False",
         "download_images": "False",
         "analyze_images": "True",
+        "analyze_colors": "True",
+        "download_workers": "16",
+        "batch_ocr": "True",
+        "max_pending_cards": "32",
+        "persist_cache": "True",
+        "ocr_engine": "tesseract",
+        "ocr_use_gpu": "False",
+        "ocr_enable_mkldnn": "True",
     }
 
     config["http"] = {
         "min_delay": "1.0",
         "max_delay": "3.0",
+        "card_rate": "2.0",
+        "card_burst": "4",
     }
 
     config["output"] = {
         "output_dir": "output",
         "incremental_save": "True",
         "save_batch_size": "10",
+        "output_format": "xlsx",
     }
 
     return config
@@ -979,4 +1577,4 @@ if __name__ == "__main__":
     )
     result = scraper.run()
 
-    print(json.dumps(result, indent=2))
+    print(_json_dumps(result, indent=True))
@@ -33,8 +33,12 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 import undetected_chromedriver as uc
+from utils import enable_keep_alive
 from typing import List, Dict, Optional, Tuple
 import requests
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 # Configuration constants
@@ -42,6 +46,200 @@ DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 )
+BASE_URL = "https://www.nobroker.in/"
+
+# Card selectors, tried in order; the first one yielding new valid cards is used
+CARD_SELECTORS = [
+    # NoBroker specific selectors
+    '[class*="nb__1Z7Qc"]',  # Common NoBroker card class pattern
+    '[class*="card"]',
+    '[class*="listing"]',
+    '[class*="property"]',
+    '[data-testid*="card"]',
+    '[data-testid*="listing"]',
+    # Generic selectors
+    'article',
+    '.card-container',
+    '.property-card',
+    '.listing-card',
+    # Backup broad selectors
+    'div[role="button"]',
+    'div[onclick*="property"]'
+]
+
+# A valid card mentions at least two of these
+PROPERTY_INDICATORS = [
+    '₹', 'lacs', 'crore', 'bhk', 'sqft', 'bathroom', 'parking',
+    'facing', 'furnished', 'floor', 'possession', 'emi'
+]
+
+# Run card discovery in the page: the same visibility, size, indicator and clickable
+# checks as _is_valid_property_card plus the _get_element_id key, for every candidate,
+# in one round trip. Returns [selector index, [[element, key], ...]] for the first
+# selector that yields cards whose keys are not in arguments[2]
+FIND_CARDS_JS = """
+var selectors = arguments[0], indicators = arguments[1], seen = new Set(arguments[2]);
+for (var s = 0; s < selectors.length; s++) {
+    var elements;
+    try { elements = document.querySelectorAll(selectors[s]); } catch (e) { continue; }
+    var found = [];
+    for (var i = 0; i < elements.length; i++) {
+        var el = elements[i];
+        var rect = el.getBoundingClientRect();
+        if (rect.height < 100 || rect.width < 200) continue;
+        var style = window.getComputedStyle(el);
+        if (style.visibility === 'hidden' || style.display === 'none') continue;
+        var text = el.innerText || '';
+        var lower = text.toLowerCase(), count = 0;
+        for (var j = 0; j < indicators.length; j++) {
+            if (lower.indexOf(indicators[j]) !== -1) count++;
+        }
+        if (count < 2) continue;
+        if (!el.querySelector("a, button, [role='button'], [onclick]")) continue;
+        var id = el.id || '', testid = el.getAttribute('data-testid') || '';
+        var key = (id || testid)
+            ? id + '_' + (el.getAttribute('class') || '') + '_' + testid
+            : Math.round(rect.left + window.scrollX) + '_' + Math.round(rect.top + window.scrollY) + '_' +
+              Math.round(rect.width) + '_' + Math.round(rect.height) + '_' + text.slice(0, 100);
+        if (seen.has(key)) continue;
+        seen.add(key);
+        found.push([el, key]);
+    }
+    if (found.length) return [s, found];
+}
+return [-1, []];
+"""
+
+# Card text patterns, compiled once; each list is tried in order and the first match wins.
+# Kept as separate scans on purpose: one named-group alternation over all fields measured
+# slower on real card text and would pick the earliest match instead of the preferred pattern
+PRICE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'₹\s*([0-9,\.]+)\s*(Lacs?|Crores?|L|Cr)\b',  # ₹62 Lacs
+    r'([0-9,\.]+)\s*(Lacs?|Crores?|L|Cr)\b',      # 62 Lacs
+    r'₹\s*([0-9,\.]+)\b',                          # ₹6200000
+)]
+EMI_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'₹\s*([0-9,]+)\s*/?\s*month',
+    r'EMI[:\s]*₹\s*([0-9,]+)',
+    r'([0-9,]+)\s*/Month',
+)]
+BHK_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*BHK',
+    r'(\d+)\s*RK',
+    r'(\d+)\s*Bedroom',
+)]
+AREA_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d{2,5})\s*sq\.?\s*ft\b',
+    r'(\d{2,5})\s*sqft\b',
+    r'(\d{2,5})\s*sq\s*metres',
+    r'(\d{2,5})\s*sqm\b',
+)]
+FACING_PATTERN = re.compile(r'\b(North|South|East|West|NE|NW|SE|SW)[\s\-]?Facing\b', re.IGNORECASE)
+BATHROOM_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*Bath',
+    r'(\d+)\s*Bathroom',
+    r'(\d+)\s*Washroom',
+)]
+PARKING_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(Bike\s*and\s*Car)\s*Parking',
+    r'(Car)\s*Parking',
+    r'(Bike)\s*Parking',
+    r'(No\s*Parking)',
+    r'(\d+)\s*Parking',
+)]
+PLACE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Specific institution patterns
+    r'([A-Za-z\s]+(?:Hospital|Medical|Clinic))\b',
+    r'([A-Za-z\s]+(?:School|College|University|Institute))\b',
+    r'([A-Za-z\s]+(?:Mall|Market|Shopping|Store))\b',
+    r'([A-Za-z\s]+(?:Station|Metro|Airport|Bus))\b',
+    r'([A-Za-z\s]+(?:Park|Garden|Ground))\b',
+    r'([A-Za-z\s]+(?:Temple|Church|Mosque|Gurudwara))\b',
+    # Common place names
+    r'\b(JSA HELIPAD|Union Bank|Uppal|Badshahpur)\b',
+    r'\b([A-Za-z]+\s+(?:Club|Gym|Hospital|School|Mall|Park))\b',
+)]
+# Patterns like "5 min to XYZ"
+DISTANCE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*(?:min|km|m)\s*(?:to|from|away)\s+([A-Za-z\s]+)',
+    r'([A-Za-z\s]+)\s*-\s*(\d+)\s*(?:min|km|m)',
+)]
+IMAGE_COUNT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*photos?',
+    r'(\d+)\s*images?',
+    r'(\d+)/\d+',  # Like "5/24" indicating current/total
+    r'View\s*(?:all\s*)?(\d+)\s*photos?',
+)]
+BACKGROUND_URL_PATTERN = re.compile(r'url\(["\']?([^"\']+)["\']?\)')
+FLOOR_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)(?:st|nd|rd|th)?\s*Floor',
+    r'Floor\s*[:-]?\s*(\d+)',
+    r'(\d+)\s*/\s*\d+\s*Floor',  # Like "3/5 Floor"
+)]
+FURNISHING_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\b(Fully\s*Furnished)\b',
+    r'\b(Semi\s*Furnished)\b',
+    r'\b(Unfurnished)\b',
+    r'\b(Furnished)\b',
+)]
+AGE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*Year[s]?\s*Old',
+    r'Age[:\s]*(\d+)\s*Year[s]?',
+    r'(\d+)\s*Yr[s]?\s*Old',
+)]
+BROKER_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(Owner)\b',
+    r'(Broker)\b',
+    r'(Agent)\b',
+    r'Posted\s*by[:\s]*([A-Za-z\s]+)',
+)]
+VERIFIED_PATTERN = re.compile(r'\bVerified\b', re.IGNORECASE)
+UNVERIFIED_PATTERN = re.compile(r'\bUnverified\b', re.IGNORECASE)
+POSSESSION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'Possession[:\s]*([A-Za-z]+\s*\d{4})',
+    r'Ready\s*to\s*Move',
+    r'Under\s*Construction',
+)]
+# Everything card validation and extraction read from one element, in a single round trip.
+# outerHTML is only requested (arguments[1]) for extraction; containers walked during
+# discovery can be large ancestors
+CARD_HANDLE_JS = """
+var el = arguments[0], rect = el.getBoundingClientRect(), style = window.getComputedStyle(el);
+function containsText(needle) {
+    return document.evaluate(".//*[contains(text(), '" + needle + "')]", el, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+}
+return {
+    text: el.innerText || '',
+    html: arguments[1] ? el.outerHTML : '',
+    tag: el.tagName.toLowerCase(),
+    class_name: el.getAttribute('class') || '',
+    element_id: el.id || '',
+    testid: el.getAttribute('data-testid') || '',
+    size: {width: Math.round(rect.width), height: Math.round(rect.height)},
+    location: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)},
+    displayed: rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+    clickable_count: el.querySelectorAll("a, button, [role='button'], [onclick]").length,
+    link_count: el.querySelectorAll("a, button").length,
+    has_price: containsText('₹'),
+    has_bhk: containsText('BHK'),
+    parent: el.parentElement
+};
+"""
+
+# Image URL filters. Short keywords like 'ad' and 'icon' only count as whole path/name
+# tokens, so 'uploads' or 'thumbnail-headline' no longer reject real listing photos
+NON_PROPERTY_IMAGE_PATTERN = re.compile(
+    r'avatar|profile|advertisement|(?:^|[/_.\-])(?:logo|icon|banner|ad)s?\d*(?=[/_.\-?]|$)', re.IGNORECASE
+)
+PROPERTY_IMAGE_PATTERN = re.compile(
+    r'property|house|apartment|flat|home|real|estate|nobroker|cloudfront|amazonaws|images', re.IGNORECASE
+)
+
+NEARBY_TEXT_PATTERN = re.compile(r'[Nn]earby')
+SECTOR_PATTERN = re.compile(r'(Sector\s*\d+)', re.IGNORECASE)
+ROOM_PREFIX_PATTERN = re.compile(r'^\d+\s*(RK|BHK)\s*', re.IGNORECASE)
+FOR_SALE_SUFFIX_PATTERN = re.compile(r'\s*For Sale.*', re.IGNORECASE)
 
 @dataclass
 class ListingData:
@@ -77,6 +275,26 @@ class ListingData:
             self.additional_amenities = []
 
 
+@dataclass
+class CardHandle:
+    """A card element plus the DOM properties read for it by CARD_HANDLE_JS"""
+    element: object
+    text: str = ""
+    html: str = ""
+    tag: str = ""
+    class_name: str = ""
+    element_id: str = ""
+    testid: str = ""
+    size: Dict[str, int] = None
+    location: Dict[str, int] = None
+    displayed: bool = False
+    clickable_count: int = 0
+    link_count: int = 0
+    has_price: bool = False
+    has_bhk: bool = False
+    parent: object = None
+
+
 class NoBrokerScraper:
     """Improved scraper with better element detection and data extraction"""
 
@@ -111,6 +329,9 @@ class NoBrokerScraper:
             "images_downloaded": 0,
             "links_extracted": 0
         }
+        # Cards are parsed on worker threads while Selenium fetches the next one
+        self.stats_lock = threading.Lock()
+        self.parse_workers = int(config.get("extraction", "parse_workers", fallback=str(min(8, os.cpu_count() or 1))))
         
         # Webdriver components
         self.driver = None
@@ -138,7 +359,12 @@ class NoBrokerScraper:
             options.add_experimental_option("prefs", prefs)
             options.add_argument(f"--user-agent={DEFAULT_USER_AGENT}")
             
+            # Return from driver.get at DOMContentLoaded; navigate_and_setup waits
+            # explicitly for listing content instead of every tracker and image
+            options.page_load_strategy = "eager"
+            
             self.driver = uc.Chrome(options=options)
+            enable_keep_alive(self.driver)
             self.driver.set_window_size(1920, 1080)
             
             self.wait = WebDriverWait(self.driver, 10)
@@ -154,43 +380,20 @@ class NoBrokerScraper:
         """Improved method to find property cards using multiple strategies"""
         cards = []
         
-        # Strategy 1: Look for common NoBroker card selectors
-        card_selectors = [
-            # NoBroker specific selectors
-            '[class*="nb__1Z7Qc"]',  # Common NoBroker card class pattern
-            '[class*="card"]',
-            '[class*="listing"]',
-            '[class*="property"]',
-            '[data-testid*="card"]',
-            '[data-testid*="listing"]',
-            # Generic selectors
-            'article',
-            '.card-container',
-            '.property-card',
-            '.listing-card',
-            # Backup broad selectors
-            'div[role="button"]',
-            'div[onclick*="property"]'
-        ]
-        
-        for selector in card_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if self._is_valid_property_card(element):
-                        # Create unique identifier
-                        element_id = self._get_element_id(element)
-                        if element_id not in self.processed_cards:
-                            cards.append(element)
-                            self.processed_cards.add(element_id)
+        # Strategy 1: Look for common NoBroker card selectors, validated in one script call
+        try:
+            selector_index, found = self.driver.execute_script(
+                FIND_CARDS_JS, CARD_SELECTORS, PROPERTY_INDICATORS, list(self.processed_cards)
+            )
+            for element, element_id in found:
+                cards.append(element)
+                self.processed_cards.add(element_id)
+            
+            if cards:
+                logging.info(f"Found {len(cards)} cards using selector: {CARD_SELECTORS[selector_index]}")
                 
-                if cards:
-                    logging.info(f"Found {len(cards)} cards using selector: {selector}")
-                    break  # Use first successful selector
-                    
-            except Exception as e:
-                logging.debug(f"Selector {selector} failed: {e}")
-                continue
+        except Exception as e:
+            logging.debug(f"Selector card search failed: {e}")
         
         # Strategy 2: If no cards found with selectors, try XPath patterns
         if not cards:
@@ -203,56 +406,53 @@ class NoBrokerScraper:
         logging.info(f"Total property cards found: {len(cards)}")
         return cards
 
-    def _is_valid_property_card(self, element) -> bool:
+    def _card_handle(self, element, include_html: bool = False) -> CardHandle:
+        """Read an element's text, attributes, geometry and content checks in one round trip"""
+        return CardHandle(element, **self.driver.execute_script(CARD_HANDLE_JS, element, include_html))
+
+    def _is_valid_property_card(self, card: CardHandle) -> bool:
         """Check if element is a valid property card"""
         try:
             # Must be visible
-            if not element.is_displayed():
+            if not card.displayed:
                 return False
             
             # Check size - property cards should be reasonably sized
-            size = element.size
+            size = card.size
             if size['height'] < 100 or size['width'] < 200:
                 return False
             
             # Check if contains property-related content
-            element_text = element.text.lower()
+            element_text = card.text.lower()
             
             # Must contain some property indicators
-            property_indicators = [
-                '₹', 'lacs', 'crore', 'bhk', 'sqft', 'bathroom', 'parking',
-                'facing', 'furnished', 'floor', 'possession', 'emi'
-            ]
-            
-            indicator_count = sum(1 for indicator in property_indicators if indicator in element_text)
+            indicator_count = sum(1 for indicator in PROPERTY_INDICATORS if indicator in element_text)
             
             # Should have at least 2 property indicators
             if indicator_count < 2:
                 return False
             
             # Check if it has clickable elements (links, buttons)
-            clickable_elements = element.find_elements(By.CSS_SELECTOR, "a, button, [role='button'], [onclick]")
-            
-            return len(clickable_elements) > 0
+            return card.clickable_count > 0
             
         except Exception as e:
             logging.debug(f"Card validation failed: {e}")
             return False
 
-    def _get_element_id(self, element) -> str:
+    def _get_element_id(self, card: CardHandle) -> str:
         """Generate unique identifier for element"""
         try:
             # Try to get unique attributes
-            element_id = element.get_attribute("id") or ""
-            class_name = element.get_attribute("class") or ""
-            data_testid = element.get_attribute("data-testid") or ""
+            element_id = card.element_id
+            class_name = card.class_name
+            data_testid = card.testid
             
             # If no unique attributes, use position and text
             if not any([element_id, data_testid]):
-                location = element.location
-                size = element.size
-                text_hash = hash(element.text[:100])  # First 100 chars of text
-                return f"{location['x']}_{location['y']}_{size['width']}_{size['height']}_{text_hash}"
+                location = card.location
+                size = card.size
+                text_head = card.text[:100]  # First 100 chars of text, as FIND_CARDS_JS keys them
+                return f"{location['x']}_{location['y']}_{size['width']}_{size['height']}_{text_head}"
             
             return f"{element_id}_{class_name}_{data_testid}"
             
@@ -282,7 +482,7 @@ class NoBrokerScraper:
                     if card_container and self._is_valid_property_card(card_container):
                         element_id = self._get_element_id(card_container)
                         if element_id not in self.processed_cards:
-                            cards.append(card_container)
+                            cards.append(card_container.element)
                             self.processed_cards.add(element_id)
                 
                 if cards:
@@ -313,7 +513,7 @@ class NoBrokerScraper:
                 if card_container and self._is_valid_property_card(card_container):
                     element_id = self._get_element_id(card_container)
                     if element_id not in self.processed_cards:
-                        cards.append(card_container)
+                        cards.append(card_container.element)
                         self.processed_cards.add(element_id)
             
             logging.info(f"Found {len(cards)} cards using text patterns")
@@ -323,36 +523,35 @@ class NoBrokerScraper:
         
         return cards
 
-    def _find_card_container(self, element, max_levels=5):
+    def _find_card_container(self, element, max_levels=5) -> Optional[CardHandle]:
         """Find the card container by traversing up the DOM"""
+        original = None
         try:
             current = element
             
             for level in range(max_levels):
                 if current:
+                    # One round trip per level reads the checks and the parent reference
+                    card = self._card_handle(current)
+                    original = original or card
+                    
                     # Check if current element looks like a card container
-                    if self._looks_like_card_container(current):
-                        return current
+                    if self._looks_like_card_container(card):
+                        return card
                     
-                    # Move to parent
-                    try:
-                        parent = current.find_element(By.XPATH, "..")
-                        if parent == current:  # Reached root
-                            break
-                        current = parent
-                    except:
-                        break
+                    # Move to parent; None once the root is reached
+                    current = card.parent
             
-            return element  # Return original if no container found
+            return original  # Return original if no container found
             
         except Exception:
-            return element
+            return original
 
-    def _looks_like_card_container(self, element) -> bool:
+    def _looks_like_card_container(self, card: CardHandle) -> bool:
         """Check if element looks like a property card container"""
         try:
-            class_name = (element.get_attribute("class") or "").lower()
-            tag_name = element.tag_name.lower()
+            class_name = card.class_name.lower()
+            tag_name = card.tag
             
             # Check for card-like class names
             card_indicators = ['card', 'listing', 'property', 'item', 'result', 'tile']
@@ -364,62 +563,78 @@ class NoBrokerScraper:
                 return True
             
             # Check size - cards should be reasonably sized
-            size = element.size
+            size = card.size
             if size['height'] >= 200 and size['width'] >= 300:
                 # Check if it contains property-specific elements
-                try:
-                    has_price = element.find_elements(By.XPATH, ".//*[contains(text(), '₹')]")
-                    has_bhk = element.find_elements(By.XPATH, ".//*[contains(text(), 'BHK')]")
-                    has_links = element.find_elements(By.CSS_SELECTOR, "a, button")
-                    
-                    return len(has_price) > 0 and (len(has_bhk) > 0 or len(has_links) > 0)
-                except:
-                    pass
+                return card.has_price and (card.has_bhk or card.link_count > 0)
             
             return False
             
         except Exception:
             return False
 
+    def _count_stat(self, key: str, amount: int = 1):
+        """Add to an extraction counter; parse workers update them concurrently"""
+        with self.stats_lock:
+            self.extraction_stats[key] += amount
+
     def extract_comprehensive_card_data(self, card_element) -> Optional[ListingData]:
         """Extract comprehensive data from a property card with improved selectors"""
+        card = self._fetch_card_handle(card_element)
+        return self._parse_card_html(card) if card else None
+
+    def _fetch_card_handle(self, card_element) -> Optional[CardHandle]:
+        """Bring a card into view and read its text and markup; the only Selenium step per card"""
         try:
-            listing_data = ListingData()
-            
             # Scroll to card and ensure it's visible
             self._scroll_to_element(card_element)
             time.sleep(0.5)
             
-            # Get all text content for fallback extraction
-            card_text = card_element.text
-            card_html = card_element.get_attribute('outerHTML')
+            # Get all text content for fallback extraction, with the markup, in one call
+            return self._card_handle(card_element, include_html=True)
+            
+        except Exception as e:
+            logging.debug(f"Card fetch failed: {e}")
+            self._count_stat("failed_extractions")
+            return None
+
+    def _parse_card_html(self, card: CardHandle) -> Optional[ListingData]:
+        """Build ListingData from a fetched card without touching the driver"""
+        try:
+            listing_data = ListingData()
+            card_text = card.text
+            card_html = card.html
+            
+            # Parse the card once; the extractors below query this tree in-process
+            # instead of issuing a WebDriver round trip per selector and attribute
+            card_soup = BeautifulSoup(card_html, "lxml")
             
             # Extract basic information using improved methods
-            self._extract_basic_info_improved(card_element, listing_data, card_text)
+            self._extract_basic_info_improved(card_soup, listing_data, card_text)
             
             # Extract images
-            self._extract_image_data_improved(card_element, listing_data)
+            self._extract_image_data_improved(card_soup, listing_data, card_text)
             
             # Extract links
-            self._extract_links_improved(card_element, listing_data)
+            self._extract_links_improved(card_soup, listing_data)
             
             # Extract nearby places with better parsing
-            self._extract_nearby_places_improved(card_element, listing_data, card_text)
+            self._extract_nearby_places_improved(card_soup, listing_data, card_text)
             
             # Extract additional details
-            self._extract_additional_details_improved(card_element, listing_data, card_text)
+            self._extract_additional_details_improved(card_soup, listing_data, card_text)
             
             # Validate extracted data
             if self._validate_listing_data(listing_data):
-                self.extraction_stats["successful_extractions"] += 1
+                self._count_stat("successful_extractions")
                 return listing_data
             else:
-                self.extraction_stats["failed_extractions"] += 1
+                self._count_stat("failed_extractions")
                 return None
             
         except Exception as e:
             logging.debug(f"Comprehensive card extraction failed: {e}")
-            self.extraction_stats["failed_extractions"] += 1
+            self._count_stat("failed_extractions")
             return None
 
     def _scroll_to_element(self, element):
@@ -430,7 +645,7 @@ class NoBrokerScraper:
         except Exception:
             pass
 
-    def _extract_basic_info_improved(self, card_element, listing_data: ListingData, card_text: str):
+    def _extract_basic_info_improved(self, card_soup, listing_data: ListingData, card_text: str):
         """Extract basic property information with improved parsing"""
         try:
             # Building/Property name - try multiple strategies
@@ -444,9 +659,8 @@ class NoBrokerScraper:
             
             for selector in title_selectors:
                 try:
-                    elements = card_element.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        text = elem.text.strip()
+                    for elem in card_soup.select(selector):
+                        text = elem.get_text(" ", strip=True)
                         if text and len(text) > 3 and not text.isdigit():
                             # Avoid common non-title texts
                             avoid_texts = ['get owner details', 'contact', 'view', 'call', 'whatsapp']
@@ -471,14 +685,8 @@ class NoBrokerScraper:
                         break
             
             # Price information - improved regex patterns
-            price_patterns = [
-                r'₹\s*([0-9,\.]+)\s*(Lacs?|Crores?|L|Cr)\b',  # ₹62 Lacs
-                r'([0-9,\.]+)\s*(Lacs?|Crores?|L|Cr)\b',      # 62 Lacs
-                r'₹\s*([0-9,\.]+)\b'                           # ₹6200000
-            ]
-            
-            for pattern in price_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in PRICE_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.price = match.group(0)
                     break
@@ -492,9 +700,8 @@ class NoBrokerScraper:
                 
                 for selector in price_selectors:
                     try:
-                        elements = card_element.find_elements(By.CSS_SELECTOR, selector)
-                        for elem in elements:
-                            text = elem.text.strip()
+                        for elem in card_soup.select(selector):
+                            text = elem.get_text(" ", strip=True)
                             if ('₹' in text or 'lacs' in text.lower() or 'crore' in text.lower()):
                                 listing_data.price = text
                                 break
@@ -504,76 +711,42 @@ class NoBrokerScraper:
                         continue
             
             # EMI information
-            emi_patterns = [
-                r'₹\s*([0-9,]+)\s*/?\s*month',
-                r'EMI[:\s]*₹\s*([0-9,]+)',
-                r'([0-9,]+)\s*/Month'
-            ]
-            
-            for pattern in emi_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in EMI_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.emi = match.group(0)
                     break
             
             # Apartment type - improved BHK detection
-            bhk_patterns = [
-                r'(\d+)\s*BHK',
-                r'(\d+)\s*RK',
-                r'(\d+)\s*Bedroom'
-            ]
-            
-            for pattern in bhk_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in BHK_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.apartment_type = f"{match.group(1)} BHK"
                     break
             
             # Buildup area - improved area detection
-            area_patterns = [
-                r'(\d{2,5})\s*sq\.?\s*ft\b',
-                r'(\d{2,5})\s*sqft\b',
-                r'(\d{2,5})\s*sq\s*metres',
-                r'(\d{2,5})\s*sqm\b'
-            ]
-            
-            for pattern in area_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in AREA_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     area_num = match.group(1)
                     listing_data.buildup_area = f"{area_num} sqft"
                     break
             
             # Facing direction
-            facing_pattern = r'\b(North|South|East|West|NE|NW|SE|SW)[\s\-]?Facing\b'
-            facing_match = re.search(facing_pattern, card_text, re.IGNORECASE)
+            facing_match = FACING_PATTERN.search(card_text)
             if facing_match:
                 listing_data.facing = facing_match.group(1).upper()
             
             # Bathrooms
-            bathroom_patterns = [
-                r'(\d+)\s*Bath',
-                r'(\d+)\s*Bathroom',
-                r'(\d+)\s*Washroom'
-            ]
-            
-            for pattern in bathroom_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in BATHROOM_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.bathrooms = match.group(1)
                     break
             
             # Parking
-            parking_patterns = [
-                r'(Bike\s*and\s*Car)\s*Parking',
-                r'(Car)\s*Parking',
-                r'(Bike)\s*Parking',
-                r'(No\s*Parking)',
-                r'(\d+)\s*Parking'
-            ]
-            
-            for pattern in parking_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in PARKING_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.parking = match.group(1)
                     break
@@ -581,41 +754,25 @@ class NoBrokerScraper:
         except Exception as e:
             logging.debug(f"Basic info extraction failed: {e}")
 
-    def _extract_nearby_places_improved(self, card_element, listing_data: ListingData, card_text: str):
+    def _extract_nearby_places_improved(self, card_soup, listing_data: ListingData, card_text: str):
         """Extract nearby places with improved parsing"""
         try:
             # Look for "Nearby" sections specifically
-            nearby_elements = card_element.find_elements(By.XPATH, 
-                ".//*[contains(text(), 'Nearby') or contains(text(), 'nearby')]")
+            nearby_strings = card_soup.find_all(string=NEARBY_TEXT_PATTERN)
             
             nearby_text = card_text
-            for elem in nearby_elements:
-                try:
-                    # Get parent container that might have the nearby places
-                    parent = elem.find_element(By.XPATH, "../..")
-                    nearby_text += " " + parent.text
-                except:
-                    nearby_text += " " + elem.text
-            
-            # Enhanced place patterns with more specific matching
-            place_patterns = [
-                # Specific institution patterns
-                r'([A-Za-z\s]+(?:Hospital|Medical|Clinic))\b',
-                r'([A-Za-z\s]+(?:School|College|University|Institute))\b', 
-                r'([A-Za-z\s]+(?:Mall|Market|Shopping|Store))\b',
-                r'([A-Za-z\s]+(?:Station|Metro|Airport|Bus))\b',
-                r'([A-Za-z\s]+(?:Park|Garden|Ground))\b',
-                r'([A-Za-z\s]+(?:Temple|Church|Mosque|Gurudwara))\b',
-                # Common place names
-                r'\b(JSA HELIPAD|Union Bank|Uppal|Badshahpur)\b',
-                r'\b([A-Za-z]+\s+(?:Club|Gym|Hospital|School|Mall|Park))\b'
-            ]
+            for string in nearby_strings:
+                elem = string.parent
+                # Get parent container that might have the nearby places
+                parent = elem.parent.parent if elem.parent and elem.parent.parent else elem
+                nearby_text += " " + parent.get_text(" ", strip=True)
             
+            # Match the precompiled place patterns
             nearby_places = set()
             text_to_search = nearby_text.lower()
             
-            for pattern in place_patterns:
-                matches = re.findall(pattern, nearby_text, re.IGNORECASE)
+            for pattern in PLACE_PATTERNS:
+                matches = pattern.findall(nearby_text)
                 for match in matches:
                     if isinstance(match, tuple):
                         match = match[0] if match[0] else match[1]
@@ -626,13 +783,8 @@ class NoBrokerScraper:
                         nearby_places.add(cleaned)
             
             # Also look for patterns like "5 min to XYZ"
-            distance_patterns = [
-                r'(\d+)\s*(?:min|km|m)\s*(?:to|from|away)\s+([A-Za-z\s]+)',
-                r'([A-Za-z\s]+)\s*-\s*(\d+)\s*(?:min|km|m)'
-            ]
-            
-            for pattern in distance_patterns:
-                matches = re.findall(pattern, nearby_text, re.IGNORECASE)
+            for pattern in DISTANCE_PATTERNS:
+                matches = pattern.findall(nearby_text)
                 for match in matches:
                     place = match[1] if len(match) > 1 else match[0]
                     place = place.strip().title()
@@ -644,48 +796,35 @@ class NoBrokerScraper:
         except Exception as e:
             logging.debug(f"Nearby places extraction failed: {e}")
 
-    def _extract_image_data_improved(self, card_element, listing_data: ListingData):
+    def _extract_image_data_improved(self, card_soup, listing_data: ListingData, card_text: str):
         """Extract image information with improved detection"""
         try:
             # Find all images in the card
-            img_elements = card_element.find_elements(By.TAG_NAME, "img")
-            
             valid_images = []
-            for img in img_elements:
-                try:
-                    src = img.get_attribute("src") or img.get_attribute("data-src") or img.get_attribute("data-lazy")
-                    if src and self._is_property_image(src):
-                        valid_images.append(src)
-                except:
+            for img in card_soup.find_all("img"):
+                src = img.get("src") or img.get("data-src") or img.get("data-lazy")
+                if not src:
                     continue
+                # Markup holds the raw attribute; resolve it the way the browser would before
+                # filtering, since the domain check expects an absolute URL
+                src = urljoin(BASE_URL, src)
+                if self._is_property_image(src):
+                    valid_images.append(src)
             
             # Also check for background images in divs
-            bg_elements = card_element.find_elements(By.CSS_SELECTOR, "[style*='background-image']")
-            for elem in bg_elements:
-                try:
-                    style = elem.get_attribute("style")
-                    url_match = re.search(r'url\(["\']?([^"\']+)["\']?\)', style)
-                    if url_match:
-                        img_url = url_match.group(1)
-                        if self._is_property_image(img_url):
-                            valid_images.append(img_url)
-                except:
-                    continue
+            for elem in card_soup.select("[style*='background-image']"):
+                url_match = BACKGROUND_URL_PATTERN.search(elem.get("style", ""))
+                if url_match:
+                    img_url = url_match.group(1)
+                    if self._is_property_image(img_url):
+                        valid_images.append(img_url)
             
             listing_data.image_urls = list(set(valid_images))  # Remove duplicates
             listing_data.image_count = len(listing_data.image_urls)
             
             # Look for image count indicators in text
-            card_text = card_element.text
-            count_patterns = [
-                r'(\d+)\s*photos?',
-                r'(\d+)\s*images?',
-                r'(\d+)/\d+',  # Like "5/24" indicating current/total
-                r'View\s*(?:all\s*)?(\d+)\s*photos?'
-            ]
-            
-            for pattern in count_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in IMAGE_COUNT_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     try:
                         total_images = int(match.group(1))
@@ -695,7 +834,7 @@ class NoBrokerScraper:
                     except:
                         continue
             
-            self.extraction_stats["images_downloaded"] += len(listing_data.image_urls)
+            self._count_stat("images_downloaded", len(listing_data.image_urls))
                     
         except Exception as e:
             logging.debug(f"Image extraction failed: {e}")
@@ -706,124 +845,82 @@ class NoBrokerScraper:
             return False
         
         # Filter out common non-property images
-        exclude_keywords = ['logo', 'icon', 'avatar', 'profile', 'banner', 'ad', 'advertisement']
-        src_lower = src.lower()
-        
-        # Must not contain exclude keywords
-        if any(keyword in src_lower for keyword in exclude_keywords):
+        if NON_PROPERTY_IMAGE_PATTERN.search(src):
             return False
         
         # Should contain property-related keywords or be from known property image domains
-        property_keywords = ['property', 'house', 'apartment', 'flat', 'home', 'real', 'estate']
-        property_domains = ['nobroker', 'cloudfront', 'amazonaws', 'images']
-        
-        return (any(keyword in src_lower for keyword in property_keywords) or
-                any(domain in src_lower for domain in property_domains))
+        return bool(PROPERTY_IMAGE_PATTERN.search(src))
 
-    def _extract_links_improved(self, card_element, listing_data: ListingData):
+    def _extract_links_improved(self, card_soup, listing_data: ListingData):
         """Extract all clickable links with improved detection"""
         try:
             # Find all links and buttons
-            clickable_elements = card_element.find_elements(By.CSS_SELECTOR, 
-                "a, button, [role='button'], [onclick], [data-href]")
+            clickable_elements = card_soup.select("a, button, [role='button'], [onclick], [data-href]")
             
             for element in clickable_elements:
-                try:
-                    href = (element.get_attribute("href") or 
-                           element.get_attribute("data-href") or
-                           element.get_attribute("onclick") or "")
-                    
-                    text = element.text.strip() or element.get_attribute("title") or element.get_attribute("aria-label") or "Link"
-                    target = element.get_attribute("target")
-                    
-                    if href and href != "#" and len(text.strip()) > 0:
-                        link_data = {
-                            "url": href,
-                            "text": text,
-                            "opens_new_tab": target == "_blank"
-                        }
-                        listing_data.links.append(link_data)
-                        
-                except:
-                    continue
-            
-            self.extraction_stats["links_extracted"] += len(listing_data.links)
+                href = (element.get("href") or
+                        element.get("data-href") or
+                        element.get("onclick") or "")
+                
+                text = element.get_text(" ", strip=True) or element.get("title") or element.get("aria-label") or "Link"
+                target = element.get("target")
+                
+                if href and href != "#" and len(text.strip()) > 0:
+                    if element.get("href"):
+                        # Match the browser's resolved href property
+                        href = urljoin(BASE_URL, href)
+                    link_data = {
+                        "url": href,
+                        "text": text,
+                        "opens_new_tab": target == "_blank"
+                    }
+                    listing_data.links.append(link_data)
+            
+            self._count_stat("links_extracted", len(listing_data.links))
             
         except Exception as e:
             logging.debug(f"Link extraction failed: {e}")
 
-    def _extract_additional_details_improved(self, card_element, listing_data: ListingData, card_text: str):
+    def _extract_additional_details_improved(self, card_soup, listing_data: ListingData, card_text: str):
         """Extract additional property details with improved parsing"""
         try:
             # Floor information - improved patterns
-            floor_patterns = [
-                r'(\d+)(?:st|nd|rd|th)?\s*Floor',
-                r'Floor\s*[:-]?\s*(\d+)',
-                r'(\d+)\s*/\s*\d+\s*Floor'  # Like "3/5 Floor"
-            ]
-            
-            for pattern in floor_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in FLOOR_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.floor = f"{match.group(1)} Floor"
                     break
             
             # Furnishing status - comprehensive patterns
-            furnishing_patterns = [
-                r'\b(Fully\s*Furnished)\b',
-                r'\b(Semi\s*Furnished)\b', 
-                r'\b(Unfurnished)\b',
-                r'\b(Furnished)\b'
-            ]
-            
-            for pattern in furnishing_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in FURNISHING_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.furnishing = match.group(1).title()
                     break
             
             # Property age
-            age_patterns = [
-                r'(\d+)\s*Year[s]?\s*Old',
-                r'Age[:\s]*(\d+)\s*Year[s]?',
-                r'(\d+)\s*Yr[s]?\s*Old'
-            ]
-            
-            for pattern in age_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in AGE_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.age = f"{match.group(1)} years"
                     break
             
             # Broker/Owner information
-            broker_patterns = [
-                r'(Owner)\b',
-                r'(Broker)\b', 
-                r'(Agent)\b',
-                r'Posted\s*by[:\s]*([A-Za-z\s]+)'
-            ]
-            
-            for pattern in broker_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in BROKER_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.broker_info = match.group(1).title()
                     break
             
             # Verification status
-            if re.search(r'\bVerified\b', card_text, re.IGNORECASE):
+            if VERIFIED_PATTERN.search(card_text):
                 listing_data.verification_status = "Verified"
-            elif re.search(r'\bUnverified\b', card_text, re.IGNORECASE):
+            elif UNVERIFIED_PATTERN.search(card_text):
                 listing_data.verification_status = "Unverified"
             
             # Possession date
-            possession_patterns = [
-                r'Possession[:\s]*([A-Za-z]+\s*\d{4})',
-                r'Ready\s*to\s*Move',
-                r'Under\s*Construction'
-            ]
-            
-            for pattern in possession_patterns:
-                match = re.search(pattern, card_text, re.IGNORECASE)
+            for pattern in POSSESSION_PATTERNS:
+                match = pattern.search(card_text)
                 if match:
                     listing_data.possession_date = match.group(1) if match.groups() else match.group(0)
                     break
@@ -888,18 +985,52 @@ class NoBrokerScraper:
             return "", ""
         
         # Extract location (Sector … or similar)
-        loc_match = re.search(r'(Sector\s*\d+)', raw_name, re.IGNORECASE)
+        loc_match = SECTOR_PATTERN.search(raw_name)
         location = loc_match.group(1).title() if loc_match else ""
         
         # Remove RK/BHK prefix
-        cleaned = re.sub(r'^\d+\s*(RK|BHK)\s*', '', raw_name, flags=re.IGNORECASE)
+        cleaned = ROOM_PREFIX_PATTERN.sub('', raw_name)
         # Remove trailing "For Sale …"
-        cleaned = re.sub(r'\s*For Sale.*', '', cleaned, flags=re.IGNORECASE)
+        cleaned = FOR_SALE_SUFFIX_PATTERN.sub('', cleaned)
         
         return cleaned.strip(), location
 
+    def _collect_parsed_card(self, index: int, future, all_extracted_data: List[Dict]) -> int:
+        """Append a parsed card's listing if it passes the filters; returns 1 when kept"""
+        if len(all_extracted_data) >= self.max_listings:
+            return 0
+        
+        try:
+            listing_data = future.result()
+            
+            if listing_data:
+                # ✅ Only keep 1 RK / 1 BHK
+                apt_type = (listing_data.apartment_type or "").strip().upper()
+                if apt_type not in ["1 BHK", "1 RK"]:
+                    return 0
+                
+                listing_dict = self._listing_data_to_dict(listing_data, len(all_extracted_data) + 1)
+                all_extracted_data.append(listing_dict)
+                return 1
+            else:
+                logging.debug(f"✗ Failed to extract data from card {index+1}")
+        
+        except Exception as e:
+            logging.debug(f"Error processing card {index+1}: {e}")
+        
+        return 0
+
     def extract_all_listings(self) -> List[Dict]:
         """Main method to extract all property listings with improved logic"""
+        try:
+            with ThreadPoolExecutor(max_workers=self.parse_workers) as executor:
+                return self._extract_all_listings(executor)
+        except Exception as e:
+            logging.error(f"Listing extraction failed: {e}")
+            return []
+
+    def _extract_all_listings(self, executor: ThreadPoolExecutor) -> List[Dict]:
+        """Page through listings; Selenium fetches cards serially while workers parse them"""
         try:
             all_extracted_data = []
             scroll_count = 0
@@ -935,31 +1066,28 @@ class NoBrokerScraper:
                 logging.info(f"Found {new_cards_count} property cards on page {scroll_count + 1}")
                 
                 successful_extractions = 0
+                pending = deque()
                 for i, card_element in enumerate(property_cards):
+                    # Cards in flight may already fill the target; wait on them before fetching
+                    # more, and only fetch again if some were filtered out or failed
+                    while pending and len(all_extracted_data) + len(pending) >= self.max_listings:
+                        successful_extractions += self._collect_parsed_card(*pending.popleft(), all_extracted_data)
                     if len(all_extracted_data) >= self.max_listings:
                         break
                     
-                    try:
-                        listing_data = self.extract_comprehensive_card_data(card_element)
-                        
-                        if listing_data:
-                            # ✅ Only keep 1 RK / 1 BHK
-                            apt_type = (listing_data.apartment_type or "").strip().upper()
-                            if apt_type not in ["1 BHK", "1 RK"]:
-                                continue
-                            
-                            listing_dict = self._listing_data_to_dict(listing_data, len(all_extracted_data) + 1)
-                            all_extracted_data.append(listing_dict)
-                            successful_extractions += 1
-                        else:
-                            logging.debug(f"✗ Failed to extract data from card {i+1}")
+                    card = self._fetch_card_handle(card_element)
+                    if card:
+                        pending.append((i, executor.submit(self._parse_card_html, card)))
                     
-                    except Exception as e:
-                        logging.debug(f"Error processing card {i+1}: {e}")
-                        continue
+                    # Keep parses that already finished, in page order
+                    while pending and pending[0][1].done():
+                        successful_extractions += self._collect_parsed_card(*pending.popleft(), all_extracted_data)
                     
                     time.sleep(random.uniform(0.2, 0.5))
                 
+                while pending:
+                    successful_extractions += self._collect_parsed_card(*pending.popleft(), all_extracted_data)
+                
                 logging.info(f"Page {scroll_count + 1} completed: {successful_extractions}/{new_cards_count} cards extracted")
                 
                 if len(all_extracted_data) < self.max_listings and scroll_count < self.max_scrolls - 1:
@@ -1194,19 +1322,24 @@ class NoBrokerScraper:
         try:
             logging.info(f"Navigating to: {url}")
             self.driver.get(url)
-            time.sleep(5)
-            
-            # Initial popup dismissal
-            self._dismiss_popups_advanced()
             
             # Wait for page to load
             try:
                 self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                # Wait a bit more for dynamic content
-                time.sleep(3)
             except TimeoutException:
                 logging.warning("Page load timeout, continuing anyway...")
             
+            # Initial popup dismissal
+            self._dismiss_popups_advanced()
+            
+            # Wait for dynamic property content to render
+            try:
+                self.wait.until(EC.presence_of_element_located(
+                    (By.XPATH, "//*[contains(text(), '₹') or contains(text(), 'BHK') or contains(text(), 'Lacs')]")
+                ))
+            except TimeoutException:
+                logging.warning("Property content wait timed out, continuing anyway...")
+            
             # Check if we can find any property-related content
             property_indicators = self.driver.find_elements(By.XPATH, 
                 "//*[contains(text(), '₹') or contains(text(), 'BHK') or contains(text(), 'Lacs')]")
@@ -1505,7 +1638,8 @@ def create_improved_config():
         "detailed_mode": "true",
         "extract_images": "true", 
         "extract_links": "true",
-        "extract_nearby_places": "true"
+        "extract_nearby_places": "true",
+        "parse_workers": "4"
     }
     
     return config
@@ -1,12 +1,17 @@
 """
 utils.py
 
-Small helper utilities for parsing price, area, timestamps, and safe extraction.
+Small helper utilities for parsing price, area, timestamps, safe extraction,
+WebDriver connection tuning and streaming xlsx sheets.
 """
 
 import re
+import logging
 from datetime import datetime, timezone, timedelta
 
+import pandas as pd
+import urllib3
+
 IST = timezone(timedelta(hours=5, minutes=30))
 
 def ist_now_str():
@@ -18,6 +23,25 @@ def safe_get_text(el):
     except Exception:
         return ""
 
+def enable_keep_alive(driver, pool_maxsize: int = 20):
+    """
+    Reuse sockets on the WebDriver command channel. Selenium's default pool
+    keeps a single connection, so bursts of commands pay a reconnect each time.
+    """
+    try:
+        executor = driver.command_executor
+        client_config = getattr(executor, "_client_config", None)
+        if client_config is not None:
+            client_config.keep_alive = True
+        executor.keep_alive = True
+        executor._conn = urllib3.PoolManager(
+            maxsize=pool_maxsize,
+            block=False,
+            timeout=getattr(client_config, "timeout", None),
+        )
+    except Exception as e:
+        logging.debug(f"Keep-alive setup skipped: {e}")
+
 def parse_area_value_unit(raw_area: str):
     """
     Parse area strings like:
@@ -129,3 +153,13 @@ def make_numeric_or_none(v):
             return int(s2)
     except Exception:
         return ""
+
+def write_sheet_rows(workbook, sheet_name: str, header, rows):
+    """Write a header and rows strictly in row order, as xlsxwriter's constant_memory requires"""
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, header)
+    for row_index, row in enumerate(rows, start=1):
+        # NaN, NaT and pd.NA cannot be stored in xlsx; leave those cells blank like to_excel does
+        worksheet.write_row(row_index, 0, [
+            None if pd.api.types.is_scalar(value) and pd.isna(value) else value for value in row
+        ])